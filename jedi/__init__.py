@@ -29,7 +29,8 @@ load
 
 __version__ = '0.18.0'
 
-from jedi.api import Script, Interpreter, set_debug_function, preload_module
+from jedi.api import Script, Interpreter, set_debug_function, preload_module, \
+    notify_changed
 from jedi import settings
 from jedi.api.environment import find_virtualenvs, find_system_environments, \
     get_default_environment, InvalidPythonEnvironment, create_environment, \
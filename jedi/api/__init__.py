@@ -7,6 +7,7 @@ Alternatively, if you don't need a custom function and are happy with printing
 debug messages to stdout, simply call :func:`set_debug_function` without
 arguments.
 """
+import os
 import sys
 from pathlib import Path
 
@@ -17,21 +18,22 @@ from jedi.parser_utils import get_executable_nodes
 from jedi import debug
 from jedi import settings
 from jedi import cache
-from jedi.file_io import KnownContentFileIO
+from jedi.file_io import KnownContentFileIO, forget_stats
 from jedi.api import classes
 from jedi.api import interpreter
 from jedi.api import helpers
-from jedi.api.helpers import validate_line_column
+from jedi.api.helpers import validate_line_column, record_statistics
 from jedi.api.completion import Completion, search_in_module
 from jedi.api.keywords import KeywordName
 from jedi.api.environment import InterpreterEnvironment
-from jedi.api.project import get_default_project, Project
+from jedi.api.project import get_default_project, Project, _get_cached_sys_path
 from jedi.api.errors import parso_to_jedi_errors
 from jedi.api import refactoring
 from jedi.api.refactoring.extract import extract_function, extract_variable
 from jedi.inference import InferenceState
 from jedi.inference import imports
 from jedi.inference.references import find_references
+from jedi.inference.statistics import record_phase
 from jedi.inference.arguments import try_iter_content
 from jedi.inference.helpers import infer_call_of_leaf
 from jedi.inference.sys_path import transform_path_to_dotted
@@ -117,14 +119,15 @@ class Script:
             project, environment=environment, script_path=self.path
         )
         debug.speed('init')
-        self._module_node, code = self._inference_state.parse_and_get_code(
-            code=code,
-            path=self.path,
-            use_latest_grammar=path and path.suffix == '.pyi',
-            cache=False,  # No disk cache, because the current script often changes.
-            diff_cache=settings.fast_parser,
-            cache_path=settings.cache_directory,
-        )
+        with record_phase(self._inference_state, 'parse'):
+            self._module_node, code = self._inference_state.parse_and_get_code(
+                code=code,
+                path=self.path,
+                use_latest_grammar=path and path.suffix == '.pyi',
+                cache=False,  # No disk cache, because the current script often changes.
+                diff_cache=settings.fast_parser,
+                cache_path=settings.cache_directory,
+            )
         debug.speed('parsed')
         self._code_lines = parso.split_lines(code, keepends=True)
         self._code = code
@@ -188,6 +191,18 @@ class Script:
             self._inference_state.environment,
         )
 
+    @property
+    def statistics(self):
+        """
+        Statistics about the last API call on this script or ``None`` if
+        :data:`jedi.settings.collect_statistics` was disabled when the script
+        was created.
+
+        :rtype: :class:`.InferenceStatistics` or None
+        """
+        return self._inference_state.statistics
+
+    @record_statistics
     @validate_line_column
     def complete(self, line=None, column=None, *, fuzzy=False):
         """
@@ -210,6 +225,7 @@ class Script:
             )
             return completion.complete()
 
+    @record_statistics
     @validate_line_column
     def infer(self, line=None, column=None, *, only_stubs=False, prefer_stubs=False):
         """
@@ -254,6 +270,7 @@ class Script:
         # the API.
         return helpers.sorted_definitions(set(defs))
 
+    @record_statistics
     @validate_line_column
     def goto(self, line=None, column=None, *, follow_imports=False, follow_builtin_imports=False,
              only_stubs=False, prefer_stubs=False):
@@ -305,6 +322,7 @@ class Script:
         # Avoid duplicates
         return list(set(helpers.sorted_definitions(defs)))
 
+    @record_statistics
     def search(self, string, *, all_scopes=False):
         """
         Searches a name in the current file. For a description of how the
@@ -332,6 +350,7 @@ class Script:
             fuzzy=fuzzy,
         )
 
+    @record_statistics
     def complete_search(self, string, **kwargs):
         """
         Like :meth:`.Script.search`, but completes that string. If you want to
@@ -347,6 +366,7 @@ class Script:
         """
         return self._search_func(string, complete=True, **kwargs)
 
+    @record_statistics
     @validate_line_column
     def help(self, line=None, column=None):
         """
@@ -384,6 +404,7 @@ class Script:
                 return [classes.Name(self._inference_state, name)]
         return []
 
+    @record_statistics
     @validate_line_column
     def get_references(self, line=None, column=None, **kwargs):
         """
@@ -414,6 +435,7 @@ class Script:
             return helpers.sorted_definitions(definitions)
         return _references(**kwargs)
 
+    @record_statistics
     @validate_line_column
     def get_signatures(self, line=None, column=None):
         """
@@ -451,6 +473,7 @@ class Script:
         return [classes.Signature(self._inference_state, signature, call_details)
                 for signature in definitions.get_signatures()]
 
+    @record_statistics
     @validate_line_column
     def get_context(self, line=None, column=None):
         """
@@ -526,6 +549,7 @@ class Script:
         finally:
             self._inference_state.is_analysis = False
 
+    @record_statistics
     def get_names(self, **kwargs):
         """
         Returns names defined in the current file.
@@ -563,6 +587,7 @@ class Script:
         ]
         return sorted(defs, key=lambda x: x.start_pos)
 
+    @record_statistics
     def rename(self, line=None, column=None, *, new_name):
         """
         Renames all references of the variable under the cursor.
@@ -575,6 +600,7 @@ class Script:
         definitions = self.get_references(line, column, include_builtins=False)
         return refactoring.rename(self._inference_state, definitions, new_name)
 
+    @record_statistics
     @validate_line_column
     def extract_variable(self, line, column, *, new_name, until_line=None, until_column=None):
         """
@@ -614,6 +640,7 @@ class Script:
             new_name, (line, column), until_pos
         )
 
+    @record_statistics
     @validate_line_column
     def extract_function(self, line, column, *, new_name, until_line=None, until_column=None):
         """
@@ -661,6 +688,7 @@ class Script:
             new_name, (line, column), until_pos
         )
 
+    @record_statistics
     def inline(self, line=None, column=None):
         """
         Inlines a variable under the cursor. This is basically the opposite of
@@ -759,6 +787,20 @@ def preload_module(*modules):
         Script(s).complete(1, len(s))
 
 
+def notify_changed(paths):
+    """
+    Tells Jedi that files or folders were changed, created or deleted. With
+    :data:`jedi.settings.file_change_notifications` enabled, Jedi doesn't check
+    the file system for changes anymore and relies on this function instead.
+
+    :param paths: The paths that changed, a list of ``str`` or ``Path``.
+    """
+    forget_stats([os.fspath(p) for p in paths])
+    # Adding or removing ``__init__.py`` and buildout files changes the sys
+    # path.
+    _get_cached_sys_path.clear_cache()
+
+
 def set_debug_function(func_cb=debug.print_to_stdout, warnings=True,
                        notices=True, speed=True):
     """
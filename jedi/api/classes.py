@@ -10,10 +10,13 @@ There are a couple of classes documented in here:
 - :class:`.Refactoring` for refactorings
 - :class:`.SyntaxError` for :meth:`.Script.get_syntax_errors` only
 
+:func:`.resolve_details` resolves details of many of them at once.
+
 These classes are the much biggest part of the API, because they contain
 the interesting information about all operations.
 """
 import re
+import time
 from pathlib import Path
 from typing import Optional
 
@@ -57,6 +60,8 @@ class BaseName:
     """
     The base class for all definitions, completions and signatures.
     """
+    __slots__ = ('_inference_state', '_name', 'is_keyword', '_memoize_method_dct')
+
     _mapping = {
         'posixpath': 'os.path',
         'riscospath': 'os.path',
@@ -605,6 +610,9 @@ class Completion(BaseName):
     ``Completion`` objects are returned from :meth:`.Script.complete`. They
     provide additional information about a completion.
     """
+    __slots__ = ('_like_name_length', '_stack', '_is_fuzzy', '_cached_name',
+                 '_same_name_completions')
+
     def __init__(self, inference_state, name, stack, like_name_length,
                  is_fuzzy, cached_name=None):
         super().__init__(inference_state, name)
@@ -747,6 +755,8 @@ class Name(BaseName):
     *Name* objects are returned from many different APIs including
     :meth:`.Script.goto` or :meth:`.Script.infer`.
     """
+    __slots__ = ()
+
     def __init__(self, inference_state, definition):
         super().__init__(inference_state, definition)
 
@@ -791,6 +801,8 @@ class BaseSignature(Name):
     These signatures are returned by :meth:`BaseName.get_signatures`
     calls.
     """
+    __slots__ = ('_signature',)
+
     def __init__(self, inference_state, signature):
         super().__init__(inference_state, signature.name)
         self._signature = signature
@@ -821,6 +833,8 @@ class Signature(BaseSignature):
     A full signature object is the return value of
     :meth:`.Script.get_signatures`.
     """
+    __slots__ = ('_call_details',)
+
     def __init__(self, inference_state, signature, call_details):
         super().__init__(inference_state, signature)
         self._call_details = call_details
@@ -857,6 +871,8 @@ class Signature(BaseSignature):
 
 
 class ParamName(Name):
+    __slots__ = ()
+
     def infer_default(self):
         """
         Returns default values like the ``1`` of ``def foo(x=1):``.
@@ -890,3 +906,57 @@ class ParamName(Name):
         :rtype: :py:attr:`inspect.Parameter.kind`
         """
         return self._name.get_kind()
+
+
+_DETAIL_FIELDS = ('type', 'docstring', 'signatures')
+
+
+def resolve_details(names, fields=_DETAIL_FIELDS, timeout=None):
+    """
+    Resolves details of many names (typically :class:`.Completion` objects)
+    at once. Editors usually need the type, docstring and signatures of all
+    visible completions. Resolving them in one call lets them share the work
+    of inference and lets the caller limit the time spent.
+
+    The fields are resolved one after another for all names, so if the
+    timeout is reached, the cheap fields like ``type`` are usually available
+    for all names, while e.g. ``docstring`` might be missing for some.
+
+    :param names: A list of :class:`BaseName` objects from the same
+        :class:`.Script`.
+    :param fields: Any of ``'type'``, ``'docstring'`` and ``'signatures'``.
+    :param timeout: The time in seconds after which no more details are
+        resolved. By default there is no limit.
+    :return: A dict of resolved fields for every name, in the same order.
+        Fields that were not resolved in time are missing.
+    :rtype: list of dict
+    """
+    for field in fields:
+        if field not in _DETAIL_FIELDS:
+            raise ValueError('Unknown field %r, use one of %s' % (field, _DETAIL_FIELDS))
+    deadline = None if timeout is None else time.perf_counter() + timeout
+
+    results = [{} for _ in names]
+    for field in fields:
+        # Names that are listed twice (e.g. duplicate completions) are only
+        # resolved once.
+        resolved = {}
+        for name, details in zip(names, results):
+            if deadline is not None and time.perf_counter() > deadline:
+                debug.dbg('resolve_details: timeout reached at field %s', field)
+                return results
+            key = type(name), id(name._name)
+            try:
+                details[field] = resolved[key]
+                continue
+            except KeyError:
+                pass
+
+            if field == 'type':
+                value = name.type
+            elif field == 'docstring':
+                value = name.docstring()
+            else:
+                value = name.get_signatures()
+            details[field] = resolved[key] = value
+    return results
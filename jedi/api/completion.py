@@ -9,11 +9,13 @@ from parso import split_lines
 
 from jedi import debug
 from jedi import settings
+from jedi.cache import signature_time_cache
 from jedi.api import classes
 from jedi.api import helpers
 from jedi.api import keywords
 from jedi.api.strings import complete_dict
 from jedi.api.file_name import complete_file_name
+from jedi.api.interpreter import MixedModuleContext
 from jedi.inference import imports
 from jedi.inference.base_value import ValueSet
 from jedi.inference.helpers import infer_call_of_leaf, parse_dotted_names
@@ -114,6 +116,22 @@ def get_flow_scope_node(module_node, position):
     return node
 
 
+@signature_time_cache("completions_validity")
+def _cache_trailer_completions(completion, dot):
+    """This function calculates the cache key."""
+    module_context = completion._module_context
+    module_path = module_context.py__file__()
+    if module_path is None or isinstance(module_context, MixedModuleContext):
+        # The namespaces of interpreters may change at any time.
+        yield None  # Don't cache!
+    else:
+        line, column = dot.end_pos
+        code_lines = completion._code_lines
+        before_dot = ''.join(code_lines[:line - 1]) + code_lines[line - 1][:column]
+        yield (module_path, before_dot, dot.start_pos)
+    yield completion._complete_trailer(dot.get_previous_leaf())
+
+
 @plugin_manager.decorate()
 def complete_param_names(context, function_name, decorator_nodes):
     # Basically there's no way to do param completion. The plugins are
@@ -278,7 +296,7 @@ class Completion:
                 )
             elif nonterminals[-1] in ('trailer', 'dotted_name') and nodes[-1] == '.':
                 dot = self._module_node.get_leaf_for_position(self._position)
-                cached_name, n = self._complete_trailer(dot.get_previous_leaf())
+                cached_name, n = _cache_trailer_completions(self, dot)
                 completion_names += n
             elif self._is_parameter_completion():
                 completion_names += self._complete_params(leaf)
@@ -4,12 +4,16 @@ static analysis. The Python binary in that environment is going to be executed.
 """
 import os
 import sys
+import json
 import hashlib
 import filecmp
 from collections import namedtuple
+from contextlib import suppress
 from shutil import which
 
+from jedi import settings
 from jedi.cache import memoize_method, time_cache
+from jedi.file_io import get_stat
 from jedi.inference.compiled.subprocess import CompiledSubprocess, \
     InferenceStateSameProcess, InferenceStateSubprocess
 
@@ -21,6 +25,9 @@ _SUPPORTED_PYTHONS = ['3.9', '3.8', '3.7', '3.6']
 _SAFE_PATHS = ['/usr/bin', '/usr/local/bin']
 _CONDA_VAR = 'CONDA_PREFIX'
 _CURRENT_VERSION = '%s.%s' % (sys.version_info.major, sys.version_info.minor)
+_INFO_CACHE_VERSION = 4
+# Besides PYTHONPATH, PYTHONHOME, etc. these change the sys path.
+_SYS_PATH_ENVIRONMENT_VARIABLES = ('VIRTUAL_ENV', _CONDA_VAR, 'HOME', 'APPDATA')
 
 
 class InvalidPythonEnvironment(Exception):
@@ -64,8 +71,17 @@ class Environment(_BaseEnvironment):
     def __init__(self, executable, env_vars=None):
         self._start_executable = executable
         self._env_vars = env_vars
-        # Initialize the environment
-        self._get_subprocess()
+        info = None
+        if env_vars is None:
+            # Environment variables might change the information.
+            info = _get_cached_info('info', executable)
+        if info is None:
+            # Initialize the environment
+            self._get_subprocess()
+        else:
+            # The executable ran before and didn't change since, the
+            # subprocess is only started once it's needed.
+            self._set_info(info)
 
     def _get_subprocess(self):
         if self._subprocess is not None and not self._subprocess.is_crashed:
@@ -81,6 +97,12 @@ class Environment(_BaseEnvironment):
                     self._start_executable,
                     exc))
 
+        if self._env_vars is None:
+            _set_cached_info('info', self._start_executable, info)
+        self._set_info(info)
+        return self._subprocess
+
+    def _set_info(self, info):
         # Since it could change and might not be the same(?) as the one given,
         # set it here.
         self.executable = info[0]
@@ -96,7 +118,6 @@ class Environment(_BaseEnvironment):
         Like :data:`sys.version_info`: a tuple to show the current
         Environment's Python version.
         """
-        return self._subprocess
 
     def __repr__(self):
         version = '.'.join(str(i) for i in self.version_info)
@@ -118,7 +139,22 @@ class Environment(_BaseEnvironment):
         # on how the Python version was compiled (ENV variables).
         # If you omit -S when starting Python (normal case), additionally
         # site.py gets executed.
-        return self._get_subprocess().get_sys_path()
+        if self._env_vars is not None:
+            return self._get_subprocess().get_sys_path()
+
+        # Installing packages changes the folders on the sys path (e.g. .pth
+        # files in site-packages), so their modification times are checked.
+        cached = _get_cached_info('sys_path', self._start_executable)
+        if cached is not None and all(_get_modification_time(p) == t for p, t in cached):
+            return [p for p, _ in cached]
+
+        sys_path = self._get_subprocess().get_sys_path()
+        _set_cached_info(
+            'sys_path',
+            self._start_executable,
+            [(p, _get_modification_time(p)) for p in sys_path],
+        )
+        return sys_path
 
 
 class _SameEnvironmentMixin:
@@ -170,6 +206,93 @@ def _calculate_sha256_for_file(path):
     return sha256.hexdigest()
 
 
+def _get_system_sha256(environment):
+    """
+    The hashes of system executables are cached, because they are calculated
+    for every virtualenv that is checked. Never use this for executables that
+    are not trusted yet, they could be replaced without changing the cache
+    key.
+    """
+    result = _get_cached_info('sha256', environment.executable)
+    if result is None:
+        result = environment._sha256
+        _set_cached_info('sha256', environment.executable, result)
+    return result
+
+
+def _get_info_cache_path():
+    return os.path.join(settings.cache_directory, 'environments.json')
+
+
+def _load_info_cache():
+    with suppress(OSError, ValueError):
+        with open(_get_info_cache_path(), encoding='utf-8') as f:
+            cache = json.load(f)
+        if cache.get('version') == _INFO_CACHE_VERSION:
+            return cache
+    return dict(version=_INFO_CACHE_VERSION, info={}, sha256={}, sys_path={})
+
+
+def _get_file_key(path):
+    """
+    Executables are identified by their real path, modification time and size,
+    so replacing or upgrading them invalidates the cache. The subprocess
+    inherits the environment variables, which change e.g. the sys path, so
+    they are part of the key as well.
+    """
+    real_path = os.path.realpath(path)
+    stat = get_stat(real_path)
+    if stat is None:
+        return None
+    return [real_path, stat.st_mtime_ns, stat.st_size, _get_environment_variables_hash()]
+
+
+def _get_environment_variables_hash():
+    variables = sorted(
+        (name, value) for name, value in os.environ.items()
+        if name.startswith('PYTHON') or name in _SYS_PATH_ENVIRONMENT_VARIABLES
+    )
+    if 'PYTHONPATH' in os.environ:
+        # Relative paths depend on the working directory.
+        variables.append(('cwd', os.getcwd()))
+    return hashlib.sha256(json.dumps(variables).encode('utf-8')).hexdigest()
+
+
+def _get_modification_time(path):
+    stat = get_stat(path)
+    return None if stat is None else stat.st_mtime_ns
+
+
+def _get_cached_info(kind, path):
+    """
+    Looks up information about an executable in a cache in the cache
+    directory, which is shared by all processes. This way an editor doesn't
+    need to start every Python executable it knows again when it's restarted.
+    """
+    try:
+        key, value = _load_info_cache()[kind][str(path)]
+    except (KeyError, ValueError, TypeError):
+        return None
+    if key != _get_file_key(path):
+        return None
+    return value
+
+
+def _set_cached_info(kind, path, value):
+    key = _get_file_key(path)
+    if key is None:
+        return
+    cache = _load_info_cache()
+    cache[kind][str(path)] = key, value
+    path = _get_info_cache_path()
+    with suppress(OSError):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = '%s.%s' % (path, os.getpid())
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, path)
+
+
 def get_default_environment():
     """
     Tries to return an active Virtualenv or conda environment.
@@ -424,6 +547,7 @@ def _is_safe(executable_path):
     # Just check the list of known Python versions. If it's not in there,
     # it's likely an attacker or some Python that was not properly
     # installed in the system.
+    sha256 = None
     for environment in find_system_environments():
         if environment.executable == real_path:
             return True
@@ -436,7 +560,9 @@ def _is_safe(executable_path):
         # virtualenv's Python is not (which is probably never going to get
         # upgraded), it will not work with Jedi. IMO that's fine, because
         # people should just be using venv. ~ dave
-        if environment._sha256 == _calculate_sha256_for_file(real_path):
+        if sha256 is None:
+            sha256 = _calculate_sha256_for_file(real_path)
+        if _get_system_sha256(environment) == sha256:
             return True
     return False
 
@@ -489,6 +489,21 @@ def validate_line_column(func):
     return wrapper
 
 
+def record_statistics(func):
+    """
+    Resets and fills :attr:`.Script.statistics` for a public API call, if
+    statistics are collected.
+    """
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        statistics = self._inference_state.statistics
+        if statistics is None:
+            return func(self, *args, **kwargs)
+        with statistics.request(func.__name__):
+            return func(self, *args, **kwargs)
+    return wrapper
+
+
 def get_module_names(module, all_scopes, definitions=True, references=False):
     """
     Returns a dictionary with name parts as keys and their call paths as
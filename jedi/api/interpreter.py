@@ -23,6 +23,8 @@ class NamespaceObject:
 
 
 class MixedTreeName(TreeNameDefinition):
+    __slots__ = ()
+
     def infer(self):
         """
         In IPython notebook it is typical that some parts of the code that is
@@ -46,6 +48,10 @@ class MixedParserTreeFilter(ParserTreeFilter):
 
 
 class MixedModuleContext(ModuleContext):
+    # The namespaces are not part of the tree, so the definitions in the tree
+    # say nothing about what a lookup finds.
+    cache_name_resolution = False
+
     def __init__(self, tree_module_value, namespaces):
         super().__init__(tree_module_value)
         self.mixed_values = [
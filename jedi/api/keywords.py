@@ -1,19 +1,20 @@
-import pydoc
+import json
+import os
+import sys
 from contextlib import suppress
+from itertools import chain
 from typing import Dict, Optional
 
+from jedi import settings
 from jedi.inference.names import AbstractArbitraryName
 
-try:
-    # https://github.com/python/typeshed/pull/4351 adds pydoc_data
-    from pydoc_data import topics  # type: ignore[import]
-    pydoc_topics: Optional[Dict[str, str]] = topics.topics
-except ImportError:
-    # Python 3.6.8 embeddable does not have pydoc_data.
-    pydoc_topics = None
+# Maps keywords and operators to a pydoc label and labels to their text.
+_help_index: Optional[Dict[str, Dict[str, str]]] = None
 
 
 class KeywordName(AbstractArbitraryName):
+    __slots__ = ()
+
     api_type = 'keyword'
 
     def py__doc__(self):
@@ -25,10 +26,72 @@ def imitate_pydoc(string):
     It's not possible to get the pydoc's without starting the annoying pager
     stuff.
     """
-    if pydoc_topics is None:
+    index = _get_help_index()
+    try:
+        return index['topics'][index['labels'][string]]
+    except KeyError:
         return ''
 
-    h = pydoc.help
+
+def _get_help_index():
+    global _help_index
+    if _help_index is None:
+        _help_index = _load_help_index()
+    return _help_index
+
+
+def _get_help_index_path():
+    version = '.'.join(str(v) for v in sys.version_info[:3])
+    return os.path.join(
+        settings.cache_directory,
+        'keyword_help',
+        '%s-%s.json' % (sys.implementation.name, version),
+    )
+
+
+def _load_help_index():
+    """
+    Loads the documentation of keywords and operators. It is built with pydoc
+    once per Python version and then stored in the cache directory, so pydoc
+    doesn't have to be imported again.
+    """
+    path = _get_help_index_path()
+    with suppress(OSError, ValueError):
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+
+    index = _build_help_index()
+    with suppress(OSError):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = '%s.%s' % (path, os.getpid())
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f)
+        os.replace(tmp_path, path)
+    return index
+
+
+def _build_help_index():
+    try:
+        # https://github.com/python/typeshed/pull/4351 adds pydoc_data
+        from pydoc_data import topics  # type: ignore[import]
+    except ImportError:
+        # Python 3.6.8 embeddable does not have pydoc_data.
+        return dict(labels={}, topics={})
+    import pydoc
+
+    h = pydoc.Helper
+    labels = {}
+    for string in chain(h.keywords, h.symbols, h.topics):
+        label = _resolve_pydoc_label(h, string)
+        if label in topics.topics:
+            labels[string] = label
+    return dict(
+        labels=labels,
+        topics={label: topics.topics[label].strip() for label in set(labels.values())},
+    )
+
+
+def _resolve_pydoc_label(h, string):
     with suppress(KeyError):
         # try to access symbols
         string = h.symbols[string]
@@ -44,9 +107,5 @@ def imitate_pydoc(string):
         # is a tuple now
         label, related = string
     except TypeError:
-        return ''
-
-    try:
-        return pydoc_topics[label].strip() if pydoc_topics else ''
-    except KeyError:
-        return ''
+        return None
+    return label
@@ -8,10 +8,13 @@ Projects can be saved to disk and loaded again, to allow project definitions to
 be used across repositories.
 """
 import json
+import time
 from pathlib import Path
+from functools import partial
 from itertools import chain
 
 from jedi import debug
+from jedi.cache import signature_time_cache
 from jedi.api.environment import get_cached_default_environment, create_environment
 from jedi.api.exceptions import WrongVersion
 from jedi.api.completion import search_in_module
@@ -21,7 +24,7 @@ from jedi.inference.imports import load_module_from_path, \
 from jedi.inference.sys_path import discover_buildout_paths
 from jedi.inference.cache import inference_state_as_method_param_cache
 from jedi.inference.references import recurse_find_python_folders_and_files, search_in_file_ios
-from jedi.file_io import FolderIO
+from jedi.file_io import FolderIO, get_stat
 
 _CONFIG_FOLDER = '.jedi'
 _CONTAINS_POTENTIAL_PROJECT = \
@@ -29,6 +32,12 @@ _CONTAINS_POTENTIAL_PROJECT = \
 
 _SERIALIZER_VERSION = 1
 
+# Maps a folder to the modification times of the folders (and config files)
+# that were looked at to find its default project and to a function that
+# creates the project.
+_default_project_cache = {}
+_RACY_MODIFICATION_TIME_NS = 2 * 10 ** 9
+
 
 def _try_to_skip_duplicates(func):
     def wrapper(*args, **kwargs):
@@ -80,13 +89,17 @@ class Project:
 
         :param path: The path of the directory you want to use as a project.
         """
+        return cls(**cls._load_data(path))
+
+    @classmethod
+    def _load_data(cls, path):
         if isinstance(path, str):
             path = Path(path)
         with open(cls._get_json_path(path)) as f:
             version, data = json.load(f)
 
         if version == 1:
-            return cls(**data)
+            return data
         else:
             raise WrongVersion(
                 "The Jedi version of this project seems newer than what we can handle."
@@ -191,6 +204,19 @@ class Project:
         Keep this method private for all users of jedi. However internally this
         one is used like a public method.
         """
+        return list(_get_cached_sys_path(
+            self, inference_state, add_parent_paths, add_init_paths))
+
+    def _get_sys_path_settings(self):
+        return (
+            self._path,
+            None if self._sys_path is None else tuple(self._sys_path),
+            tuple(self.added_sys_path),
+            self._smart_sys_path,
+            self._django,
+        )
+
+    def _calculate_sys_path(self, inference_state, add_parent_paths, add_init_paths):
         suffixed = list(self.added_sys_path)
         prefixed = []
 
@@ -365,6 +391,21 @@ class Project:
         return '<%s: %s>' % (self.__class__.__name__, self._path)
 
 
+@signature_time_cache("sys_path_validity")
+def _get_cached_sys_path(project, inference_state, add_parent_paths, add_init_paths):
+    script_path = inference_state.script_path
+    # Only the folder of the script matters, so all modules of a folder share
+    # the sys path.
+    yield (
+        project._get_sys_path_settings(),
+        inference_state.environment,
+        None if script_path is None else script_path.parent,
+        add_parent_paths,
+        add_init_paths,
+    )
+    yield project._calculate_sys_path(inference_state, add_parent_paths, add_init_paths)
+
+
 def _is_potential_project(path):
     for name in _CONTAINS_POTENTIAL_PROJECT:
         try:
@@ -400,15 +441,60 @@ def get_default_project(path=None):
         path = Path(path)
 
     check = path.absolute()
+    if check.is_file():
+        # A file is never a project, the search starts at its folder.
+        check = check.parent
+    elif not check.is_dir():
+        create_project, _ = _find_default_project(path, check)
+        return create_project()
+
+    # Editors ask for the project of every file they open, the folders of a
+    # project therefore only need to be searched once. Adding or removing
+    # files in a folder changes its modification time.
+    try:
+        modification_times, create_project = _default_project_cache[check]
+    except KeyError:
+        pass
+    else:
+        if all(_get_modification_time(p) == t for p, t in modification_times):
+            return create_project()
+
+    create_project, modification_times = _find_default_project(path, check)
+    # File systems store modification times with a limited precision, so a
+    # folder that was changed just now might change again without a visible
+    # difference. Such results are not cached.
+    racy_time = time.time_ns() - _RACY_MODIFICATION_TIME_NS
+    if all(t is None or t < racy_time for _, t in modification_times):
+        _default_project_cache[check] = modification_times, create_project
+    # Projects can be modified, so every caller gets a new one.
+    return create_project()
+
+
+def _get_modification_time(path):
+    stat = get_stat(path)
+    return None if stat is None else stat.st_mtime_ns
+
+
+def _find_default_project(path, check):
+    """
+    Returns a function that creates the project and the modification times of
+    the paths that were checked.
+    """
     probable_path = None
     first_no_init_file = None
+    modification_times = []
     for dir in chain([check], check.parents):
+        modification_times.append((dir, _get_modification_time(dir)))
         try:
-            return Project.load(dir)
+            data = Project._load_data(dir)
         except (FileNotFoundError, IsADirectoryError, PermissionError):
             pass
         except NotADirectoryError:
             continue
+        else:
+            json_path = Project._get_json_path(dir)
+            modification_times.append((json_path, _get_modification_time(json_path)))
+            return partial(Project, **data), modification_times
 
         if first_no_init_file is None:
             if dir.joinpath('__init__.py').exists():
@@ -419,22 +505,26 @@ def get_default_project(path=None):
                 first_no_init_file = dir
 
         if _is_django_path(dir):
-            project = Project(dir)
-            project._django = True
-            return project
+            return partial(_create_django_project, dir), modification_times
 
         if probable_path is None and _is_potential_project(dir):
             probable_path = dir
 
     if probable_path is not None:
         # TODO search for setup.py etc
-        return Project(probable_path)
+        return partial(Project, probable_path), modification_times
 
     if first_no_init_file is not None:
-        return Project(first_no_init_file)
+        return partial(Project, first_no_init_file), modification_times
 
     curdir = path if path.is_dir() else path.parent
-    return Project(curdir)
+    return partial(Project, curdir), modification_times
+
+
+def _create_django_project(path):
+    project = Project(path)
+    project._django = True
+    return project
 
 
 def _remove_imports(names):
@@ -18,6 +18,8 @@ _sentinel = object()
 
 
 class StringName(AbstractArbitraryName):
+    __slots__ = ()
+
     api_type = 'string'
     is_value_name = False
 
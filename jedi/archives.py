@@ -0,0 +1,152 @@
+"""
+Indexes of zip archives (zipapps, eggs, ...) on the sys path. Modules in
+archives are usually found by the importer in the subprocess, which scans the
+archive and decompresses the module for every lookup. An index lists the
+members of an archive once, so the submodules of packages in archives can be
+found and listed without the subprocess.
+
+Indexes are cached until the archive changes.
+"""
+import os
+import stat
+import zipfile
+from functools import lru_cache
+from inspect import getmodulename
+
+from jedi.file_io import get_stat
+
+# Maps the path of an archive to its stat key and its ArchiveIndex (None if
+# the file is not an archive).
+_archive_cache = {}
+
+_SOURCE_CACHE_SIZE = 128
+"""
+The decompressed sources of this many modules in archives are kept.
+"""
+
+
+class ArchiveIndex:
+    def __init__(self, path, stat_key, member_names):
+        self.path = path
+        self._stat_key = stat_key
+        # Maps folders in the archive ('' is the root) to the names of the
+        # folders and files in them.
+        self._folders = {'': (set(), set())}
+        for member_name in member_names:
+            parts = member_name.rstrip('/').split('/')
+            folder = ''
+            for part in parts[:-1]:
+                self._add_folder(folder, part)
+                folder = _join(folder, part)
+            if member_name.endswith('/'):
+                self._add_folder(folder, parts[-1])
+            else:
+                self._folders[folder][1].add(parts[-1])
+
+    def _add_folder(self, folder, name):
+        self._folders[folder][0].add(name)
+        self._folders.setdefault(_join(folder, name), (set(), set()))
+
+    def find_module(self, folder, name):
+        """
+        Works like ``get_module_info`` of the subprocess for a folder in the
+        archive. Returns ``(member name, is_package)``, ``(None, True)`` for
+        namespace packages and ``(None, None)`` if the module doesn't exist.
+        Returns None for modules that are only available as bytecode, those
+        are left to the importer.
+        """
+        try:
+            folder_names, file_names = self._folders[folder]
+        except KeyError:
+            return None, None
+        if name in folder_names:
+            package = _join(folder, name)
+            init_names = self._folders[package][1]
+            if '__init__.py' in init_names:
+                return _join(package, '__init__.py'), True
+            if '__init__.pyc' in init_names:
+                return None
+        if name + '.py' in file_names:
+            return _join(folder, name + '.py'), False
+        if name + '.pyc' in file_names:
+            return None
+        if name in folder_names:
+            return None, True
+        return None, None
+
+    def iter_module_names(self, folder):
+        """
+        Lists the names of the modules in a folder of the archive like
+        ``iter_module_names`` of the subprocess.
+        """
+        try:
+            folder_names, file_names = self._folders[folder]
+        except KeyError:
+            return
+        for name in folder_names:
+            if name != '__pycache__' and name.isidentifier():
+                yield name
+        for name in file_names:
+            modname = name[:-4] if name.endswith('.pyi') else getmodulename(name)
+            if modname and '.' not in modname and modname != '__init__':
+                yield modname
+
+    def get_path(self, member_name):
+        return os.path.join(self.path, *member_name.split('/'))
+
+    def read(self, member_name):
+        return _read_member(self.path, self._stat_key, member_name)
+
+
+def get_archive_index(path):
+    """
+    Returns ``(ArchiveIndex, folder in the archive)`` if a path points to an
+    archive or a folder in it, otherwise None.
+    """
+    archive_path = os.fspath(path)
+    parts = []
+    while True:
+        stat_result = get_stat(archive_path)
+        if stat_result is not None:
+            break
+        archive_path, name = os.path.split(archive_path)
+        if not name:
+            return None
+        parts.append(name)
+    if not stat.S_ISREG(stat_result.st_mode):
+        return None
+
+    index = _get_index(archive_path, stat_result)
+    if index is None:
+        return None
+    return index, '/'.join(reversed(parts))
+
+
+def _get_index(archive_path, stat_result):
+    stat_key = stat_result.st_mtime_ns, stat_result.st_size
+    try:
+        cached_key, index = _archive_cache[archive_path]
+        if cached_key == stat_key:
+            return index
+    except KeyError:
+        pass
+
+    try:
+        with zipfile.ZipFile(archive_path) as f:
+            index = ArchiveIndex(archive_path, stat_key, f.namelist())
+    except (OSError, zipfile.BadZipFile):
+        index = None
+    _archive_cache[archive_path] = stat_key, index
+    return index
+
+
+@lru_cache(maxsize=_SOURCE_CACHE_SIZE)
+def _read_member(archive_path, stat_key, member_name):
+    # The stat key is part of the cache key, so changed archives are read
+    # again.
+    with zipfile.ZipFile(archive_path) as f:
+        return f.read(member_name)
+
+
+def _join(folder, name):
+    return folder + '/' + name if folder else name
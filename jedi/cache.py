@@ -70,8 +70,14 @@ def signature_time_cache(time_add_setting):
             value = next(generator)
             time_add = getattr(settings, time_add_setting)
             if key is not None:
-                dct[key] = time.time() + time_add, value
+                now = time.time()
+                # Remove expired entries, so old values (and the inference
+                # states they belong to) can be garbage collected.
+                for expired_key in [k for k, (e, _) in dct.items() if e <= now]:
+                    del dct[expired_key]
+                dct[key] = now + time_add, value
             return value
+        wrapper.clear_cache = dct.clear
         return wrapper
     return _temp
 
@@ -100,10 +106,22 @@ def time_cache(seconds):
 
 
 def memoize_method(method):
-    """A normal memoize function."""
+    """
+    A normal memoize function.
+
+    The cache is stored in the ``_memoize_method_dct`` attribute and only
+    created once a memoized method is called. Classes that use ``__slots__``
+    need to reserve a slot with that name.
+    """
     @wraps(method)
     def wrapper(self, *args, **kwargs):
-        cache_dict = self.__dict__.setdefault('_memoize_method_dct', {})
+        # Avoid `__getattr__` of wrapper classes, they would forward the
+        # lookup to the wrapped object.
+        try:
+            cache_dict = object.__getattribute__(self, '_memoize_method_dct')
+        except AttributeError:
+            cache_dict = {}
+            object.__setattr__(self, '_memoize_method_dct', cache_dict)
         dct = cache_dict.setdefault(method, {})
         key = (args, frozenset(kwargs.items()))
         try:
@@ -2,6 +2,56 @@ import os
 
 from parso import file_io
 
+from jedi import settings
+
+# Maps paths to their ``os.stat`` result (or None if they don't exist). Only
+# used if ``settings.file_change_notifications`` is enabled.
+_stat_cache = {}
+
+
+def get_stat(path):
+    """
+    Returns the ``os.stat`` result of a path or None if it cannot be accessed.
+    If Jedi is notified about changes, the result is only calculated once.
+    """
+    if not settings.file_change_notifications:
+        if _stat_cache:
+            _stat_cache.clear()
+        return _stat(path)
+
+    path = os.path.abspath(path)
+    try:
+        return _stat_cache[path]
+    except KeyError:
+        result = _stat_cache[path] = _stat(path)
+        return result
+
+
+def _stat(path):
+    try:
+        return os.stat(path)
+    except (OSError, ValueError):
+        return None
+
+
+def forget_stats(paths):
+    """
+    Forgets the stat results of the given paths, of their folders (creating
+    and deleting files changes the modification time of a folder) and of
+    everything within them, if they are folders.
+    """
+    if not _stat_cache:
+        return
+    prefixes = []
+    for path in paths:
+        path = os.path.abspath(path)
+        _stat_cache.pop(path, None)
+        _stat_cache.pop(os.path.dirname(path), None)
+        prefixes.append(os.path.join(path, ''))
+    prefixes = tuple(prefixes)
+    for path in [p for p in _stat_cache if p.startswith(prefixes)]:
+        del _stat_cache[path]
+
 
 class AbstractFolderIO:
     def __init__(self, path):
@@ -37,24 +87,52 @@ class FolderIO(AbstractFolderIO):
         return FolderIO(os.path.dirname(self.path))
 
     def walk(self):
-        for root, dirs, files in os.walk(self.path):
-            root_folder_io = FolderIO(root)
-            original_folder_ios = [FolderIO(os.path.join(root, d)) for d in dirs]
-            modified_folder_ios = list(original_folder_ios)
+        for root, dir_names, file_names in self.walk_names():
+            folder_ios = [FolderIO(os.path.join(root, d)) for d in dir_names]
             yield (
-                root_folder_io,
-                modified_folder_ios,
-                [FileIO(os.path.join(root, f)) for f in files],
+                FolderIO(root),
+                folder_ios,
+                [FileIO(os.path.join(root, f)) for f in file_names],
+            )
+            # Folders removed from folder_ios are not walked.
+            dir_names[:] = [f.get_base_name() for f in folder_ios]
+
+    def walk_names(self):
+        """
+        Like ``os.walk``, but without creating IO objects. Removing names from
+        the yielded folder names avoids walking these folders.
+
+        :yields: ``(path, folder names, file names)``
+        """
+        stack = [os.fspath(self.path)]
+        while stack:
+            root = stack.pop()
+            dir_names = []
+            file_names = []
+            links = set()
+            try:
+                with os.scandir(root) as it:
+                    for entry in it:
+                        # DirEntry usually knows the type without a stat call.
+                        try:
+                            is_dir = entry.is_dir()
+                        except OSError:
+                            is_dir = False
+                        if is_dir:
+                            dir_names.append(entry.name)
+                            if entry.is_symlink():
+                                links.add(entry.name)
+                        else:
+                            file_names.append(entry.name)
+            except OSError:
+                continue
+            yield root, dir_names, file_names
+            # Like os.walk, symlinks to folders are not followed.
+            stack.extend(
+                os.path.join(root, name)
+                for name in reversed(dir_names)
+                if name not in links
             )
-            modified_iterator = iter(reversed(modified_folder_ios))
-            current = next(modified_iterator, None)
-            i = len(original_folder_ios)
-            for folder_io in reversed(original_folder_ios):
-                i -= 1   # Basically enumerate but reversed
-                if current is folder_io:
-                    current = next(modified_iterator, None)
-                else:
-                    del dirs[i]
 
 
 class FileIOFolderMixin:
@@ -69,14 +147,17 @@ class ZipFileIO(file_io.KnownContentFileIO, FileIOFolderMixin):
         self._zip_path = zip_path
 
     def get_last_modified(self):
-        try:
-            return os.path.getmtime(self._zip_path)
-        except (FileNotFoundError, PermissionError, NotADirectoryError):
-            return None
+        stat = get_stat(self._zip_path)
+        return None if stat is None else stat.st_mtime
 
 
 class FileIO(file_io.FileIO, FileIOFolderMixin):
-    pass
+    def get_last_modified(self):
+        """
+        Returns float - timestamp or None, if path doesn't exist.
+        """
+        stat = get_stat(self.path)
+        return None if stat is None else stat.st_mtime
 
 
 class KnownContentFileIO(file_io.KnownContentFileIO, FileIOFolderMixin):
@@ -0,0 +1,168 @@
+"""
+Matches paths against ``.gitignore`` files. Jedi uses this to skip ignored
+files and folders when it walks through a project, for example to search for
+names or references.
+
+Patterns are translated to regular expressions once per ``.gitignore`` file.
+Nested ``.gitignore`` files are supported, the patterns of deeper files win.
+"""
+import os
+import re
+
+from jedi.file_io import get_stat
+
+# Maps the path of a .gitignore file to its stat key and its patterns.
+_gitignore_cache = {}
+
+
+class Gitignore:
+    def __init__(self, lines):
+        patterns = [p for p in map(_parse_line, lines) if p is not None]
+        # Later patterns win. Consecutive patterns that have the same result
+        # are combined into one regex and checked from the back.
+        self._file_regexes = _combine(p for p in patterns if not p[2])
+        self._folder_regexes = _combine(patterns)
+
+    def match(self, relative_path, is_dir):
+        """
+        Returns True if the path is ignored, False if it is explicitly not
+        ignored (``!pattern``) and None if no pattern matches.
+
+        :param relative_path: A path relative to the folder of the
+            ``.gitignore``, separated by ``/``.
+        """
+        regexes = self._folder_regexes if is_dir else self._file_regexes
+        for regex, negated in regexes:
+            if regex.match(relative_path) is not None:
+                return not negated
+        return None
+
+
+def get_gitignore(folder_path):
+    """
+    Returns the :class:`Gitignore` of a folder or None if the folder doesn't
+    have a ``.gitignore``. The parsed patterns are cached until the file
+    changes.
+    """
+    path = os.path.join(folder_path, '.gitignore')
+    stat = get_stat(path)
+    if stat is None:
+        _gitignore_cache.pop(path, None)
+        return None
+
+    key = stat.st_mtime_ns, stat.st_size
+    try:
+        cached_key, gitignore = _gitignore_cache[path]
+        if cached_key == key:
+            return gitignore
+    except KeyError:
+        pass
+
+    try:
+        with open(path, 'rb') as f:
+            lines = f.read().decode('utf-8', 'ignore').splitlines()
+    except OSError:
+        gitignore = None
+    else:
+        gitignore = Gitignore(lines)
+    _gitignore_cache[path] = key, gitignore
+    return gitignore
+
+
+def is_ignored(gitignores, path, is_dir):
+    """
+    :param gitignores: A list of ``(folder path, Gitignore)``, ordered from the
+        outermost to the innermost folder.
+    """
+    ignored = False
+    for folder_path, gitignore in gitignores:
+        relative_path = path[len(folder_path) + 1:]
+        if os.path.sep != '/':
+            relative_path = relative_path.replace(os.path.sep, '/')
+        result = gitignore.match(relative_path, is_dir)
+        if result is not None:
+            ignored = result
+    return ignored
+
+
+def _combine(patterns):
+    runs = []
+    for regex, negated, _ in patterns:
+        if runs and runs[-1][1] == negated:
+            runs[-1][0].append(regex)
+        else:
+            runs.append(([regex], negated))
+    return [
+        (re.compile('(?:%s)\\Z' % '|'.join(regexes), re.DOTALL), negated)
+        for regexes, negated in reversed(runs)
+    ]
+
+
+def _parse_line(line):
+    """
+    Returns ``(regex, negated, dir_only)`` or None for empty lines and
+    comments.
+    """
+    if line.startswith('#'):
+        return None
+    stripped = line.rstrip(' ')
+    if stripped.endswith('\\') and len(stripped) < len(line):
+        # An escaped trailing space
+        stripped += ' '
+    line = stripped
+
+    negated = line.startswith('!')
+    if negated:
+        line = line[1:]
+    dir_only = line.endswith('/')
+    if dir_only:
+        line = line[:-1]
+    if not line:
+        return None
+
+    # A slash at the beginning or in the middle anchors a pattern to the
+    # folder of the .gitignore, otherwise it matches in any folder below.
+    anchored = '/' in line
+    parts = line.lstrip('/').split('/')
+    regex = '' if anchored else '(?:.*/)?'
+    for i, part in enumerate(parts):
+        is_last = i == len(parts) - 1
+        if part == '**':
+            regex += '.*' if is_last else '(?:.*/)?'
+        else:
+            regex += _translate_part(part) + ('' if is_last else '/')
+    return regex, negated, dir_only
+
+
+def _translate_part(part):
+    regex = ''
+    i = 0
+    n = len(part)
+    while i < n:
+        c = part[i]
+        i += 1
+        if c == '*':
+            regex += '[^/]*'
+        elif c == '?':
+            regex += '[^/]'
+        elif c == '\\' and i < n:
+            regex += re.escape(part[i])
+            i += 1
+        elif c == '[':
+            j = i
+            if j < n and part[j] in '!^':
+                j += 1
+            if j < n and part[j] == ']':
+                j += 1
+            end = part.find(']', j)
+            if end == -1:
+                regex += '\\['
+            else:
+                content = part[i:end].replace('\\', '\\\\')
+                if content[0] in '!^':
+                    content = '^' + content[1:]
+                regex += '[%s]' % content
+                i = end + 1
+        else:
+            regex += re.escape(c)
+    return regex
@@ -70,6 +70,7 @@ from jedi import settings
 from jedi.inference import imports
 from jedi.inference import recursion
 from jedi.inference.cache import inference_state_function_cache
+from jedi.inference.statistics import InferenceStatistics
 from jedi.inference import helpers
 from jedi.inference.names import TreeNameDefinition
 from jedi.inference.base_value import ContextualizedNode, \
@@ -92,6 +93,7 @@ class InferenceState:
 
         self.latest_grammar = parso.load_grammar(version='3.7')
         self.memoize_cache = {}  # for memoize decorators
+        self.name_resolution_cache = {}  # see `AbstractContext.goto()`
         self.module_cache = imports.ModuleCache()  # does the job of `sys.modules`.
         self.stub_module_cache = {}  # Dict[Tuple[str, ...], Optional[ModuleValue]]
         self.compiled_cache = {}  # see `inference.compiled.create()`
@@ -104,6 +106,8 @@ class InferenceState:
         self.access_cache = {}
         self.allow_descriptor_getattr = False
         self.flow_analysis_enabled = True
+        # Only collected if requested, see `settings.collect_statistics`.
+        self.statistics = InferenceStatistics() if settings.collect_statistics else None
 
         self.reset_recursion_limitations()
 
@@ -115,6 +119,9 @@ class InferenceState:
     @plugin_manager.decorate()
     def execute(value, arguments):
         debug.dbg('execute: %s %s', value, arguments)
+        statistics = value.inference_state.statistics
+        if statistics is not None:
+            statistics.execute_calls += 1
         with debug.increase_indent_cm():
             value_set = value.py__call__(arguments=arguments)
         debug.dbg('execute result: %s in %s', value_set, value)
@@ -191,6 +198,8 @@ class InferenceState:
         if len(code) > settings._cropped_file_size:
             code = code[:settings._cropped_file_size]
 
+        if self.statistics is not None:
+            self.statistics.parsed_modules += 1
         grammar = self.latest_grammar if use_latest_grammar else self.grammar
         return grammar.parse(code=code, path=path, file_io=file_io, **kwargs), code
 
@@ -125,6 +125,8 @@ def _parse_argument_clinic(string):
 
 
 class _AbstractArgumentsMixin:
+    __slots__ = ()
+
     def unpack(self, funcdef=None):
         raise NotImplementedError
 
@@ -133,6 +135,8 @@ class _AbstractArgumentsMixin:
 
 
 class AbstractArguments(_AbstractArgumentsMixin):
+    __slots__ = ()
+
     context = None
     argument_node = None
     trailer = None
@@ -164,6 +168,8 @@ def unpack_arglist(arglist):
 
 
 class TreeArguments(AbstractArguments):
+    __slots__ = ('argument_node', 'context', '_inference_state', 'trailer')
+
     def __init__(self, inference_state, context, argument_node, trailer=None):
         """
         :param argument_node: May be an argument_node or a list of nodes.
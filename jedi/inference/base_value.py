@@ -364,6 +364,8 @@ class TreeValue(Value):
 
 
 class ContextualizedNode:
+    __slots__ = ('context', 'node')
+
     def __init__(self, context, node):
         self.context = context
         self.node = node
@@ -406,13 +408,19 @@ def _getitem(value, index_values, contextualized_node):
 
 
 class ValueSet:
+    __slots__ = ('_set',)
+
     def __init__(self, iterable):
         self._set = frozenset(iterable)
-        for value in iterable:
-            assert not isinstance(value, ValueSet)
+        if debug.debug_function:
+            # Checking every element is too expensive to do it all the time.
+            for value in self._set:
+                assert not isinstance(value, ValueSet)
 
     @classmethod
     def _from_frozen_set(cls, frozenset_):
+        if not frozenset_ and cls is ValueSet:
+            return NO_VALUES
         self = cls.__new__(cls)
         self._set = frozenset_
         return self
@@ -422,15 +430,42 @@ class ValueSet:
         """
         Used to work with an iterable of set.
         """
-        aggregated = set()
+        # Most of the time there are only zero or one non-empty sets, in that
+        # case nothing needs to be aggregated.
+        first = None
+        second = None
+        aggregated = None
         for set_ in sets:
-            if isinstance(set_, ValueSet):
+            if not isinstance(set_, ValueSet):
+                set_ = cls(set_)
+            if not set_._set:
+                continue
+            if first is None:
+                first = set_
+            elif second is None:
+                second = set_
+            elif aggregated is None:
+                aggregated = set(first._set)
+                aggregated |= second._set
                 aggregated |= set_._set
             else:
-                aggregated |= frozenset(set_)
-        return cls._from_frozen_set(frozenset(aggregated))
+                aggregated |= set_._set
+
+        if aggregated is not None:
+            return cls._from_frozen_set(frozenset(aggregated))
+        if second is not None:
+            return cls._from_frozen_set(first._set | second._set)
+        if first is None:
+            return cls._from_frozen_set(frozenset())
+        if type(first) is not cls:
+            return cls._from_frozen_set(first._set)
+        return first
 
     def __or__(self, other):
+        if not other._set:
+            return self
+        if not self._set:
+            return other
         return self._from_frozen_set(self._set | other._set)
 
     def __and__(self, other):
@@ -479,8 +514,10 @@ class ValueSet:
                 [l for l in lazy_values if l is not None]
             )
 
+    # The following methods could also be mapped by `__getattr__`, but they are
+    # called so often that it's worth avoiding the closures for them.
     def execute(self, arguments):
-        return ValueSet.from_sets(c.inference_state.execute(c, arguments) for c in self._set)
+        return ValueSet.from_sets([c.inference_state.execute(c, arguments) for c in self._set])
 
     def execute_with_values(self, *args, **kwargs):
         return ValueSet.from_sets(c.execute_with_values(*args, **kwargs) for c in self._set)
@@ -489,7 +526,13 @@ class ValueSet:
         return reduce(add, [c.goto(*args, **kwargs) for c in self._set], [])
 
     def py__getattribute__(self, *args, **kwargs):
-        return ValueSet.from_sets(c.py__getattribute__(*args, **kwargs) for c in self._set)
+        return ValueSet.from_sets([c.py__getattribute__(*args, **kwargs) for c in self._set])
+
+    def infer(self):
+        return ValueSet.from_sets([c.infer() for c in self._set])
+
+    def execute_annotation(self):
+        return ValueSet.from_sets([c.execute_annotation() for c in self._set])
 
     def get_item(self, *args, **kwargs):
         return ValueSet.from_sets(_getitem(c, *args, **kwargs) for c in self._set)
@@ -126,8 +126,11 @@ class InferenceStateSubprocess(_InferenceStateProcess):
         def wrapper(*args, **kwargs):
             self._used = True
 
+            inference_state = self._inference_state_weakref()
+            if inference_state is not None and inference_state.statistics is not None:
+                inference_state.statistics.subprocess_calls += 1
             result = self._compiled_subprocess.run(
-                self._inference_state_weakref(),
+                inference_state,
                 func,
                 args=args,
                 kwargs=kwargs,
@@ -1,13 +1,15 @@
 from abc import abstractmethod
+from bisect import bisect_left
 from contextlib import contextmanager
 
 from parso.tree import search_ancestor
-from parso.python.tree import Name
+from parso.python.tree import Name, Flow
 
 from jedi.inference.filters import ParserTreeFilter, MergedFilter, \
     GlobalNameFilter
 from jedi.inference.names import AnonymousParamName, TreeNameDefinition
 from jedi.inference.base_value import NO_VALUES, ValueSet
+from jedi.inference.cache import inference_state_function_cache
 from jedi.parser_utils import get_parent_scope
 from jedi import debug
 from jedi import parser_utils
@@ -26,10 +28,24 @@ class AbstractContext:
 
     def goto(self, name_or_str, position):
         from jedi.inference import finder
-        filters = _get_global_filters_for_name(
-            self, name_or_str if isinstance(name_or_str, Name) else None, position,
-        )
+        name_or_none = name_or_str if isinstance(name_or_str, Name) else None
+        position = _get_position_for_name(name_or_none, position)
+
+        key = _get_name_resolution_key(self, name_or_str, position)
+        if key is not None:
+            cache = self.inference_state.name_resolution_cache
+            try:
+                names = cache[key]
+            except KeyError:
+                pass
+            else:
+                debug.dbg('context.goto %s in (%s): %s (cached)', name_or_str, self, names)
+                return list(names)
+
+        filters = get_global_filters(self, position, name_or_none)
         names = finder.filter_name(filters, name_or_str)
+        if key is not None:
+            cache[key] = tuple(names)
         debug.dbg('context.goto %s in (%s): %s', name_or_str, self, names)
         return names
 
@@ -307,6 +323,9 @@ class FunctionContext(TreeContextMixin, ValueContext):
 
 
 class ModuleContext(TreeContextMixin, ValueContext):
+    # Name lookups in this module may be cached, see `AbstractContext.goto`.
+    cache_name_resolution = True
+
     def py__file__(self):
         return self._value.py__file__()
 
@@ -409,7 +428,7 @@ class CompiledModuleContext(CompiledContext):
         return self._value.py__file__()
 
 
-def _get_global_filters_for_name(context, name_or_none, position):
+def _get_position_for_name(name_or_none, position):
     # For functions and classes the defaults don't belong to the
     # function and get inferred in the value before the function. So
     # make sure to exclude the function/class name.
@@ -426,8 +445,76 @@ def _get_global_filters_for_name(context, name_or_none, position):
             if position is not None and position < colon.start_pos:
                 if lambdef is None or position < lambdef.children[-2].start_pos:
                     position = ancestor.start_pos
+    return position
+
+
+@inference_state_function_cache()
+def _get_definition_positions(inference_state, module_node, string_name):
+    return sorted(
+        name.start_pos
+        for name in module_node.get_used_names().get(string_name, ())
+        if name.is_definition(include_setitem=True)
+    )
+
+
+def _get_origin_key(name):
+    """
+    Filters only look at the flows and scopes around the origin of a lookup
+    (and at the branches of them it is in), so two names with the same flow
+    and scope ancestors resolve the same way.
+    """
+    if name.parent.type in ('param', 'tfpdef'):
+        # Param names are special cased in `get_parent_scope`.
+        return None
+    key = []
+    child = name
+    node = name.parent
+    while node is not None:
+        if isinstance(node, Flow) or parser_utils.is_scope(node):
+            key.append((node, child))
+        child = node
+        node = node.parent
+    return tuple(key)
+
+
+def _get_name_resolution_key(context, name_or_str, position):
+    """
+    Returns the key for `InferenceState.name_resolution_cache` or None if the
+    lookup cannot be cached.
+
+    The position only matters in relation to the definitions of a name:
+    Lookups between the same two definitions find the same names. Therefore
+    the number of definitions before the position is used instead of the
+    position itself.
+    """
+    root_context = context
+    while True:
+        if root_context.predefined_names:
+            # Flow analysis depends on the names predefined for if/for.
+            return None
+        if root_context.parent_context is None:
+            break
+        root_context = root_context.parent_context
+    if not getattr(root_context, 'cache_name_resolution', False):
+        return None
 
-    return get_global_filters(context, position, name_or_none)
+    if isinstance(name_or_str, Name):
+        string_name = name_or_str.value
+        origin_key = _get_origin_key(name_or_str)
+        if origin_key is None:
+            return None
+    else:
+        string_name = name_or_str
+        origin_key = None
+
+    if position is None:
+        bucket = None
+    else:
+        bucket = bisect_left(_get_definition_positions(
+            context.inference_state, root_context.tree_node, string_name
+        ), position)
+    return (context, string_name, bucket, origin_key,
+            context.inference_state.flow_analysis_enabled)
 
 
 def get_global_filters(context, until_position, origin_scope):
@@ -1,12 +1,13 @@
 """
 Docstrings are another source of information for functions and classes.
 :mod:`jedi.inference.dynamic_params` tries to find all executions of functions,
-while the docstring parsing is much easier. There are three different types of
+while the docstring parsing is much easier. There are four different types of
 docstrings that |jedi| understands:
 
 - `Sphinx <http://sphinx-doc.org/markup/desc.html#info-field-lists>`_
 - `Epydoc <http://epydoc.sourceforge.net/manual-fields.html>`_
 - `Numpydoc <https://github.com/numpy/numpy/blob/master/doc/HOWTO_DOCUMENT.rst.txt>`_
+- `Google <https://google.github.io/styleguide/pyguide.html#38-comments-and-docstrings>`_
 
 For example, the sphinx annotation ``:type foo: str`` clearly states that the
 type of ``foo`` is ``str``.
@@ -15,12 +16,16 @@ As an addition to parameter searching, this module also provides return
 annotations.
 """
 
+import inspect
 import re
 import warnings
+from functools import lru_cache
 
 from parso import parse, ParserSyntaxError
 
 from jedi import debug
+from jedi import settings
+from jedi.cache import memoize_method
 from jedi.inference.cache import inference_state_method_cache
 from jedi.inference.base_value import iterator_to_value_set, ValueSet, \
     NO_VALUES
@@ -28,9 +33,9 @@ from jedi.inference.lazy_value import LazyKnownValues
 
 
 DOCSTRING_PARAM_PATTERNS = [
-    r'\s*:type\s+%s:\s*([^\n]+)',  # Sphinx
-    r'\s*:param\s+(\w+)\s+%s:[^\n]*',  # Sphinx param with type
-    r'\s*@type\s+%s:\s*([^\n]+)',  # Epydoc
+    re.compile(r'\s*:type\s+(?P<name>\w+):\s*(?P<type>[^\n]+)'),  # Sphinx
+    re.compile(r'\s*:param\s+(?P<type>\w+)\s+(?P<name>\w+):[^\n]*'),  # Sphinx param with type
+    re.compile(r'\s*@type\s+(?P<name>\w+):\s*(?P<type>[^\n]+)'),  # Epydoc
 ]
 
 DOCSTRING_RETURN_PATTERNS = [
@@ -40,6 +45,15 @@ DOCSTRING_RETURN_PATTERNS = [
 
 REST_ROLE_PATTERN = re.compile(r':[^`]+:`([^`]+)`')
 
+_GOOGLE_SECTION_PATTERN = re.compile(
+    r'(\s*)(Args|Arguments|Parameters|Keyword Args|Keyword Arguments'
+    r'|Returns|Yields):\s*$'
+)
+_GOOGLE_PARAM_PATTERN = re.compile(r'\*{0,2}(\w+)\s*\((.+)\)\s*:')
+_GOOGLE_RETURN_PATTERN = re.compile(r'([^:]+):')
+_NUMPY_UNDERLINE_PATTERN = re.compile(r'\s*-{3,}\s*$')
+_OPTIONAL_PATTERN = re.compile(r'([^,]+(,[^,]+)*?)(,[ ]*optional)?$')
+
 
 _numpy_doc_string_cache = None
 
@@ -48,52 +62,205 @@ def _get_numpy_doc_string_cls():
     global _numpy_doc_string_cache
     if isinstance(_numpy_doc_string_cache, (ImportError, SyntaxError)):
         raise _numpy_doc_string_cache
-    from numpydoc.docscrape import NumpyDocString  # type: ignore[import]
-    _numpy_doc_string_cache = NumpyDocString
+    if _numpy_doc_string_cache is None:
+        try:
+            from numpydoc.docscrape import NumpyDocString  # type: ignore[import]
+        except (ImportError, SyntaxError) as e:
+            # Don't try to import it again and again.
+            _numpy_doc_string_cache = e
+            raise
+        _numpy_doc_string_cache = NumpyDocString
     return _numpy_doc_string_cache
 
 
-def _search_param_in_numpydocstr(docstr, param_str):
-    """Search `docstr` (in numpydoc format) for type(-s) of `param_str`."""
+def _parse_numpy_sections_with_numpydoc(docstr):
     with warnings.catch_warnings():
         warnings.simplefilter("ignore")
         try:
             # This is a non-public API. If it ever changes we should be
             # prepared and return gracefully.
-            params = _get_numpy_doc_string_cls()(docstr)._parsed_data['Parameters']
+            parsed_data = _get_numpy_doc_string_cls()(docstr)._parsed_data
+            return {
+                section: [(entry[0], entry[1]) for entry in parsed_data[section]]
+                for section in ('Parameters', 'Returns', 'Yields')
+            }
         except Exception:
-            return []
-    for p_name, p_type, p_descr in params:
-        if p_name == param_str:
-            m = re.match(r'([^,]+(,[^,]+)*?)(,[ ]*optional)?$', p_type)
-            if m:
-                p_type = m.group(1)
-            return list(_expand_typestr(p_type))
-    return []
+            return {}
 
 
-def _search_return_in_numpydocstr(docstr):
+def _parse_numpy_sections(docstr):
     """
-    Search `docstr` (in numpydoc format) for type(-s) of function returns.
+    A fast parser for the sections of NumPy style docstrings. Returns a dict
+    of section title to a list of (name, type) entries.
+
+    >>> _parse_numpy_sections(\'\'\'
+    ...     Parameters
+    ...     ----------
+    ...     x : int
+    ...         The x.
+    ...     \'\'\')
+    {'Parameters': [('x', 'int')]}
     """
-    with warnings.catch_warnings():
-        warnings.simplefilter("ignore")
+    lines = inspect.cleandoc(docstr).splitlines()
+    sections = {}
+    entries = None
+    for i, line in enumerate(lines):
+        if _NUMPY_UNDERLINE_PATTERN.match(line):
+            continue
+        if i + 1 < len(lines) and line.strip() \
+                and _NUMPY_UNDERLINE_PATTERN.match(lines[i + 1]):
+            entries = sections.setdefault(line.strip(), [])
+        elif entries is not None and line[:1].strip():
+            # Entries are not indented, their descriptions are.
+            name, _, type_ = line.partition(' : ')
+            entries.append((name.strip().rstrip(' :'), type_.strip()))
+    return sections
+
+
+def _parse_google_sections(docstr):
+    """
+    Parses the sections of Google style docstrings. Returns a dict of
+    section title to a list of (name, type) entries. Return types have no
+    name.
+
+    >>> _parse_google_sections(\'\'\'
+    ...     Args:
+    ...         x (int): The x.
+    ...     Returns:
+    ...         str: A description.
+    ...     \'\'\')
+    {'Args': [('x', 'int')], 'Returns': [('', 'str')]}
+    """
+    sections = {}
+    entries = None
+    for line in inspect.cleandoc(docstr).splitlines():
+        if not line.strip():
+            continue
+        indent = len(line) - len(line.lstrip())
+        match = _GOOGLE_SECTION_PATTERN.match(line)
+        if match is not None:
+            section = match.group(2)
+            entries = sections.setdefault(section, [])
+            section_indent = indent
+            entry_indent = None
+            continue
+        if entries is None:
+            continue
+        if indent <= section_indent:
+            entries = None
+            continue
+        if entry_indent is None:
+            entry_indent = indent
+        if indent != entry_indent:
+            continue  # A description
+
+        if section in ('Returns', 'Yields'):
+            match = _GOOGLE_RETURN_PATTERN.match(line.strip())
+            if match is not None and not entries:
+                entries.append(('', match.group(1).strip()))
+        else:
+            match = _GOOGLE_PARAM_PATTERN.match(line.strip())
+            if match is not None:
+                entries.append((match.group(1), match.group(2).strip()))
+    return sections
+
+
+def _strip_optional(type_str):
+    m = _OPTIONAL_PATTERN.match(type_str)
+    if m:
+        return m.group(1)
+    return type_str
+
+
+class _ParsedDocstring:
+    """
+    The types a docstring defines. The parsing happens lazily and only once,
+    because the same docstrings are looked at over and over again.
+    """
+    def __init__(self, docstr, numpy_parser):
+        self._docstr = docstr
+        self._numpy_parser = numpy_parser
+
+    @memoize_method
+    def _get_google_sections(self):
+        return _parse_google_sections(self._docstr)
+
+    @memoize_method
+    def _get_numpy_sections(self):
+        if self._numpy_parser != 'builtin':
+            try:
+                _get_numpy_doc_string_cls()
+            except (ImportError, SyntaxError):
+                if self._numpy_parser == 'numpydoc':
+                    return {}
+            else:
+                return _parse_numpy_sections_with_numpydoc(self._docstr)
+        return _parse_numpy_sections(self._docstr)
+
+    @memoize_method
+    def _get_param_types(self):
+        param_types = {}
+        for pattern in DOCSTRING_PARAM_PATTERNS:
+            for match in pattern.finditer(self._docstr):
+                param_types.setdefault(
+                    match.group('name'),
+                    [_strip_rst_role(match.group('type'))]
+                )
+
+        google_sections = self._get_google_sections()
+        for section in ('Args', 'Arguments', 'Parameters',
+                        'Keyword Args', 'Keyword Arguments'):
+            for name, type_str in google_sections.get(section, []):
+                param_types.setdefault(
+                    name, list(_expand_typestr(_strip_optional(type_str))))
+        return param_types
+
+    @memoize_method
+    def _get_numpy_param_types(self):
+        param_types = {}
+        for names, type_str in self._get_numpy_sections().get('Parameters', []):
+            for name in names.split(','):
+                param_types.setdefault(
+                    name.strip(), list(_expand_typestr(_strip_optional(type_str))))
+        return param_types
+
+    def get_param_types(self, param_str):
         try:
-            doc = _get_numpy_doc_string_cls()(docstr)
-        except Exception:
-            return
-    try:
-        # This is a non-public API. If it ever changes we should be
-        # prepared and return gracefully.
-        returns = doc._parsed_data['Returns']
-        returns += doc._parsed_data['Yields']
-    except Exception:
-        return
-    for r_name, r_type, r_descr in returns:
-        # Return names are optional and if so the type is in the name
-        if not r_type:
-            r_type = r_name
-        yield from _expand_typestr(r_type)
+            return self._get_param_types()[param_str]
+        except KeyError:
+            # NumPy style docstrings are only parsed if necessary.
+            return self._get_numpy_param_types().get(param_str, [])
+
+    @memoize_method
+    def get_return_types(self):
+        types = []
+        for p in DOCSTRING_RETURN_PATTERNS:
+            match = p.search(self._docstr)
+            if match:
+                types.append(_strip_rst_role(match.group(1)))
+
+        google_sections = self._get_google_sections()
+        for section in ('Returns', 'Yields'):
+            for _, type_str in google_sections.get(section, []):
+                types += _expand_typestr(type_str)
+
+        numpy_sections = self._get_numpy_sections()
+        for section in ('Returns', 'Yields'):
+            for r_name, r_type in numpy_sections.get(section, []):
+                # Return names are optional and if so the type is in the name
+                if not r_type:
+                    r_type = r_name
+                types += _expand_typestr(r_type)
+        return types
+
+
+@lru_cache(maxsize=1000)
+def _parse_docstring(docstr, numpy_parser):
+    return _ParsedDocstring(docstr, numpy_parser)
+
+
+def _get_parsed_docstring(docstr):
+    return _parse_docstring(docstr, settings.docstring_parser)
 
 
 def _expand_typestr(type_str):
@@ -146,15 +313,7 @@ def _search_param_in_docstr(docstr, param_str):
     ['int']
 
     """
-    # look at #40 to see definitions of those params
-    patterns = [re.compile(p % re.escape(param_str))
-                for p in DOCSTRING_PARAM_PATTERNS]
-    for pattern in patterns:
-        match = pattern.search(docstr)
-        if match:
-            return [_strip_rst_role(match.group(1))]
-
-    return _search_param_in_numpydocstr(docstr, param_str)
+    return list(_get_parsed_docstring(docstr).get_param_types(param_str))
 
 
 def _strip_rst_role(type_str):
@@ -274,13 +433,6 @@ def infer_param(function_value, param):
 @inference_state_method_cache()
 @iterator_to_value_set
 def infer_return_types(function_value):
-    def search_return_in_docstr(code):
-        for p in DOCSTRING_RETURN_PATTERNS:
-            match = p.search(code)
-            if match:
-                yield _strip_rst_role(match.group(1))
-        # Check for numpy style return hint
-        yield from _search_return_in_numpydocstr(code)
-
-    for type_str in search_return_in_docstr(function_value.py__doc__()):
+    types = _get_parsed_docstring(function_value.py__doc__()).get_return_types()
+    for type_str in types:
         yield from _infer_for_statement_string(function_value.get_root_context(), type_str)
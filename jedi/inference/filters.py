@@ -54,6 +54,29 @@ class FilterWrapper:
         return self.wrap_names(self._wrapped_filter.values())
 
 
+class CachedFilter(AbstractFilter):
+    """
+    Remembers the names of a filter. Only use this for filters whose result
+    does not depend on a position or an origin scope.
+    """
+    def __init__(self, wrapped_filter):
+        self._wrapped_filter = wrapped_filter
+        self._cache = {}
+
+    def get(self, name):
+        try:
+            names = self._cache[name]
+        except KeyError:
+            names = self._cache[name] = tuple(self._wrapped_filter.get(name))
+        return list(names)
+
+    def values(self):
+        return self._wrapped_filter.values()
+
+    def __repr__(self):
+        return '<%s: %s>' % (self.__class__.__name__, self._wrapped_filter)
+
+
 def _get_definition_names(parso_cache_node, used_names, name_key):
     if parso_cache_node is None:
         names = used_names.get(name_key, ())
@@ -10,7 +10,8 @@ from inspect import Parameter
 
 from parso import ParserSyntaxError, parse
 
-from jedi.inference.cache import inference_state_method_cache
+from jedi.inference.cache import inference_state_method_cache, \
+    inference_state_function_cache
 from jedi.inference.base_value import ValueSet, NO_VALUES
 from jedi.inference.gradual.base import DefineGenericBaseClass, GenericClass
 from jedi.inference.gradual.generics import TupleGenericManager
@@ -62,8 +63,14 @@ def _infer_annotation_string(context, string, index=None):
 
 
 def _get_forward_reference_node(context, string):
+    # The node is cached, so that the inference of it is cached as well.
+    return _parse_forward_reference(context.inference_state, context.tree_node, string)
+
+
+@inference_state_function_cache()
+def _parse_forward_reference(inference_state, tree_node, string):
     try:
-        new_node = context.inference_state.grammar.parse(
+        new_node = inference_state.grammar.parse(
             string,
             start_symbol='eval_input',
             error_recovery=False
@@ -72,9 +79,9 @@ def _get_forward_reference_node(context, string):
         debug.warning('Annotation not parsed: %s' % string)
         return None
     else:
-        module = context.tree_node.get_root_node()
+        module = tree_node.get_root_node()
         parser_utils.move(new_node, module.end_pos[0])
-        new_node.parent = context.tree_node
+        new_node.parent = tree_node
         return new_node
 
 
@@ -117,7 +124,8 @@ def infer_param(function_value, param, ignore_stars=False):
     inference_state = function_value.inference_state
     if param.star_count == 1:
         tuple_ = builtin_from_name(inference_state, 'tuple')
-        return ValueSet([GenericClass(
+        return ValueSet([GenericClass.create_cached(
+            inference_state,
             tuple_,
             TupleGenericManager((values,)),
         )])
@@ -127,7 +135,8 @@ def infer_param(function_value, param, ignore_stars=False):
             ValueSet([builtin_from_name(inference_state, 'str')]),
             values
         )
-        return ValueSet([GenericClass(
+        return ValueSet([GenericClass.create_cached(
+            inference_state,
             dct,
             TupleGenericManager(generics),
         )])
@@ -228,11 +237,26 @@ def infer_return_types(function, arguments):
         return annotation_values.execute_annotation()
 
     type_var_dict = infer_type_vars_for_execution(function, arguments, all_annotations)
+    return _execute_with_type_vars(
+        function.inference_state,
+        annotation_values,
+        frozenset(type_var_dict.items()),
+    )
+
 
+@inference_state_function_cache()
+def _execute_with_type_vars(inference_state, value_set, type_vars):
+    """
+    Defines the given type vars (pairs of name and values) in the annotation
+    classes and executes them. Many calls of a generic function end up with
+    the same type vars, so this is cached.
+    """
+    type_var_dict = dict(type_vars)
     return ValueSet.from_sets(
-        ann.define_generics(type_var_dict)
-        if isinstance(ann, (DefineGenericBaseClass, TypeVar)) else ValueSet({ann})
-        for ann in annotation_values
+        v.define_generics(type_var_dict)
+        if isinstance(v, (DefineGenericBaseClass, TypeVar))
+        else ValueSet({v})
+        for v in value_set
     ).execute_annotation()
 
 
@@ -269,11 +293,20 @@ def infer_type_vars_for_execution(function, arguments, annotation_dict):
                 actual_value_set = actual_value_set.try_merge('_dict_values')
             merge_type_var_dicts(
                 annotation_variable_results,
-                annotation_value_set.infer_type_vars(actual_value_set),
+                _infer_type_vars(context.inference_state, annotation_value_set,
+                                 actual_value_set),
             )
     return annotation_variable_results
 
 
+@inference_state_function_cache()
+def _infer_type_vars(inference_state, annotation_value_set, actual_value_set):
+    # The same generic function is often called with the same values, e.g.
+    # `dict.get` with a string. Keying by the values and not by their classes
+    # is necessary, because e.g. list literals know their content.
+    return annotation_value_set.infer_type_vars(actual_value_set)
+
+
 def infer_return_for_callable(arguments, param_values, result_values):
     all_type_vars = {}
     for pv in param_values:
@@ -199,7 +199,11 @@ class GenericClass(DefineGenericBaseClass, ClassMixin):
             yield _LazyGenericBaseClass(self, base, self._generics_manager)
 
     def _create_instance_with_generics(self, generics_manager):
-        return GenericClass(self._class_value, generics_manager)
+        return GenericClass.create_cached(
+            self.inference_state,
+            self._class_value,
+            generics_manager,
+        )
 
     def is_sub_class_of(self, class_value):
         if super().is_sub_class_of(class_value):
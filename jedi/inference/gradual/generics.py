@@ -77,13 +77,24 @@ class LazyGenericManager(_AbstractGenericManager):
                 return True
         return False
 
+    def __eq__(self, other):
+        # Managers are compared by what they were created from, so that
+        # equal generic classes can be shared, see `create_cached`.
+        return isinstance(other, LazyGenericManager) \
+            and self._context_of_index == other._context_of_index \
+            and self._index_value == other._index_value
+
+    def __hash__(self):
+        return hash((self._context_of_index, self._index_value))
+
     def __repr__(self):
         return '<LazyG>[%s]' % (', '.join(repr(x) for x in self.to_tuple()))
 
 
 class TupleGenericManager(_AbstractGenericManager):
     def __init__(self, tup):
-        self._tuple = tup
+        # Some callers pass lists, but the generics need to be hashable.
+        self._tuple = tuple(tup)
 
     def __getitem__(self, index):
         return self._tuple[index]
@@ -97,5 +108,11 @@ class TupleGenericManager(_AbstractGenericManager):
     def is_homogenous_tuple(self):
         return False
 
+    def __eq__(self, other):
+        return isinstance(other, TupleGenericManager) and self._tuple == other._tuple
+
+    def __hash__(self):
+        return hash(self._tuple)
+
     def __repr__(self):
         return '<TupG>[%s]' % (', '.join(repr(x) for x in self.to_tuple()))
@@ -1,6 +1,7 @@
 from jedi.inference.base_value import ValueWrapper
 from jedi.inference.value.module import ModuleValue
-from jedi.inference.filters import ParserTreeFilter
+from jedi.inference.cache import inference_state_method_cache
+from jedi.inference.filters import ParserTreeFilter, CachedFilter
 from jedi.inference.names import StubName, StubModuleName
 from jedi.inference.gradual.typing import TypingModuleFilterWrapper
 from jedi.inference.context import ModuleContext
@@ -34,10 +35,21 @@ class StubModuleValue(ModuleValue):
         return names
 
     def _get_stub_filters(self, origin_scope):
-        return [StubFilter(
-            parent_context=self.as_context(),
-            origin_scope=origin_scope
-        )] + list(self.iter_star_filters())
+        if origin_scope is None or origin_scope.get_root_node() != self.tree_node:
+            # Lookups from outside (e.g. of builtins or typing names) find the
+            # same names every time, because stubs don't care about positions.
+            stub_filter = self._get_public_stub_filter(
+                self.inference_state.flow_analysis_enabled)
+        else:
+            stub_filter = StubFilter(
+                parent_context=self.as_context(),
+                origin_scope=origin_scope
+            )
+        return [stub_filter] + list(self.iter_star_filters())
+
+    @inference_state_method_cache()
+    def _get_public_stub_filter(self, flow_analysis_enabled):
+        return CachedFilter(StubFilter(parent_context=self.as_context()))
 
     def get_filters(self, origin_scope=None):
         filters = super().get_filters(origin_scope)
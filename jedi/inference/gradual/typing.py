@@ -135,7 +135,8 @@ class ProxyWithGenerics(BaseTypingClassWithGenerics):
         return ValueSet.from_sets(self._generics_manager.to_tuple())
 
     def _create_instance_with_generics(self, generics_manager):
-        return ProxyWithGenerics(
+        return ProxyWithGenerics.create_cached(
+            self.inference_state,
             self.parent_context,
             self._tree_name,
             generics_manager
@@ -229,7 +230,8 @@ class TypingClassWithGenerics(ProxyWithGenerics, _TypingClassMixin):
         return type_var_dict
 
     def _create_instance_with_generics(self, generics_manager):
-        return TypingClassWithGenerics(
+        return TypingClassWithGenerics.create_cached(
+            self.inference_state,
             self.parent_context,
             self._tree_name,
             generics_manager
@@ -0,0 +1,190 @@
+"""
+A graph of the imports between the modules of a project. It is used to find
+the modules that are most likely to use a name, which are the modules that
+(directly or indirectly) import the module that defines it.
+
+Imports are found with a regex instead of parsing and inferring every module.
+A few edges might therefore be wrong (e.g. imports in strings), which is fine
+for ordering modules. The imports of a module are cached until its file
+changes, so only changed modules are read again when the graph is rebuilt.
+"""
+import os
+import re
+
+from parso import python_bytes_to_unicode
+
+from jedi.file_io import get_stat
+
+_IMPORT_REGEX = re.compile(
+    r'^[ \t]*(?:'
+    r'from[ \t]+(\.*[\w.]*)[ \t]+import[ \t]*(\([^)]*\)|(?:\\\r?\n|[^\n])*)'
+    r'|import[ \t]+((?:\\\r?\n|[^\n])*))',
+    re.MULTILINE
+)
+_COMMENT_REGEX = re.compile(r'#[^\n]*')
+
+# Maps module paths to ``(stat key, imports)``. The imports are tuples of
+# ``(level, dotted name, imported names)``.
+_module_cache = {}
+
+
+class ImportGraph:
+    def __init__(self, paths, imports):
+        #: The paths of all modules in the order they were found.
+        self.paths = paths
+        # Maps a path to the paths of the modules it imports.
+        self._imports = imports
+        self._importers = None
+
+    def __contains__(self, path):
+        return os.fspath(path) in self._imports
+
+    def get_imports(self, path):
+        """
+        Returns the paths of the modules a module imports.
+        """
+        return self._imports.get(os.fspath(path), set())
+
+    def get_importers(self, path):
+        """
+        Returns the paths of the modules that import a module.
+        """
+        if self._importers is None:
+            self._importers = {}
+            for importer, imported_paths in self._imports.items():
+                for imported in imported_paths:
+                    self._importers.setdefault(imported, set()).add(importer)
+        return self._importers.get(os.fspath(path), set())
+
+    def get_importer_distances(self, paths):
+        """
+        Returns a dict of the paths of the modules that import the given
+        modules (directly or indirectly) and the number of imports in between.
+        The given modules have a distance of 0.
+        """
+        distances = {}
+        todo = [os.fspath(p) for p in paths]
+        distance = 0
+        while todo:
+            next_todo = []
+            for path in todo:
+                if path not in distances:
+                    distances[path] = distance
+                    next_todo += self.get_importers(path)
+            todo = next_todo
+            distance += 1
+        return distances
+
+    def sort_by_reachability(self, paths):
+        """
+        Returns the paths of all modules, the modules that import the given
+        modules first, ordered by their distance.
+        """
+        distances = self.get_importer_distances(paths)
+        no_import = len(self.paths)
+        return sorted(self.paths, key=lambda p: distances.get(p, no_import))
+
+
+def build_import_graph(paths):
+    """
+    :param paths: The paths of the modules of a project.
+    """
+    paths = [os.fspath(p) for p in paths]
+    # Modules can be imported in many ways (depending on the sys path), so
+    # every module is known by all the dotted names its path ends with. Too
+    # many edges are fine, missing ones are not.
+    names = {}
+    # Maps paths without a suffix (folders for packages) to modules.
+    locations = {}
+    for path in paths:
+        location = _remove_suffix(path)
+        locations.setdefault(location, []).append(path)
+        dotted = ()
+        while True:
+            location, name = os.path.split(location)
+            name = re.sub(r'-stubs$', '', name)
+            if not name.isidentifier():
+                break
+            dotted = (name,) + dotted
+            names.setdefault(dotted, []).append(path)
+
+    imports = {}
+    for path in paths:
+        imported_paths = imports[path] = set()
+        for level, name, imported_names in _get_imports(path):
+            # ``import a.b.c`` imports the packages a and a.b as well and
+            # ``from a import b`` might import a submodule.
+            dotted_names = [name[:i] for i in range(1, len(name) + 1)]
+            dotted_names += [name + (n,) for n in imported_names]
+            if level:
+                folder = os.path.dirname(path)
+                for _ in range(level - 1):
+                    folder = os.path.dirname(folder)
+                imported_paths.update(locations.get(folder, ()))
+                for dotted in dotted_names:
+                    imported_paths.update(locations.get(os.path.join(folder, *dotted), ()))
+            else:
+                for dotted in dotted_names:
+                    imported_paths.update(names.get(dotted, ()))
+
+    # Submodules are available as attributes of their packages.
+    for location, module_paths in locations.items():
+        for package_path in locations.get(os.path.dirname(location), ()):
+            imports[package_path].update(module_paths)
+    for path, imported_paths in imports.items():
+        imported_paths.discard(path)
+    return ImportGraph(paths, imports)
+
+
+def _remove_suffix(path):
+    path, suffix = os.path.splitext(path)
+    if os.path.basename(path) == '__init__':
+        return os.path.dirname(path)
+    return path
+
+
+def _get_imports(path):
+    stat = get_stat(path)
+    stat_key = None if stat is None else (stat.st_mtime_ns, stat.st_size)
+    try:
+        cached_key, imports = _module_cache[path]
+        if cached_key == stat_key:
+            return imports
+    except KeyError:
+        pass
+
+    try:
+        with open(path, 'rb') as f:
+            code = python_bytes_to_unicode(f.read(), errors='replace')
+    except OSError:
+        imports = ()
+    else:
+        imports = tuple(_iter_imports(code))
+    _module_cache[path] = stat_key, imports
+    return imports
+
+
+def _iter_imports(code):
+    for match in _IMPORT_REGEX.finditer(code):
+        from_name, imported, import_names = match.groups()
+        names = _COMMENT_REGEX.sub('', import_names if from_name is None else imported)
+        names, _, rest = names.partition(';')
+        if from_name is None:
+            for name in _split_names(names):
+                yield 0, tuple(name.split('.')), ()
+        else:
+            level = len(from_name) - len(from_name.lstrip('.'))
+            dotted = from_name[level:]
+            name = tuple(dotted.split('.')) if dotted else ()
+            yield level, name, tuple(_split_names(names.strip('()')))
+        if rest:
+            # More statements on the same line
+            yield from _iter_imports(rest.lstrip())
+
+
+def _split_names(names):
+    for part in names.replace('\\', ' ').split(','):
+        # ``import foo as bar``
+        words = part.split()
+        if words and all(n.isidentifier() for n in words[0].split('.')):
+            yield words[0]
@@ -16,7 +16,8 @@ from parso.tree import search_ancestor
 
 from jedi import debug
 from jedi import settings
-from jedi.file_io import FolderIO
+from jedi.archives import get_archive_index
+from jedi.file_io import FolderIO, ZipFileIO
 from jedi.parser_utils import get_cached_code_lines
 from jedi.inference import sys_path
 from jedi.inference import helpers
@@ -29,6 +30,7 @@ from jedi.inference.base_value import ValueSet, NO_VALUES
 from jedi.inference.gradual.typeshed import import_module_decorator, \
     create_stub_module, parse_stub_module
 from jedi.inference.compiled.subprocess.functions import ImplicitNSInfo
+from jedi.inference.snapshot import get_import_snapshot
 from jedi.plugins import plugin_manager
 
 
@@ -408,12 +410,18 @@ def import_module(inference_state, import_names, parent_module_value, sys_path):
     if parent_module_value is None:
         # Override the sys.path. It works only good that way.
         # Injecting the path directly into `find_module` did not work.
-        file_io_or_ns, is_pkg = inference_state.compiled_subprocess.get_module_info(
-            string=import_names[-1],
-            full_name=module_name,
-            sys_path=sys_path,
-            is_global_search=True,
-        )
+        snapshot = get_import_snapshot(inference_state, sys_path)
+        result = None if snapshot is None else snapshot.get(module_name)
+        if result is None:
+            result = inference_state.compiled_subprocess.get_module_info(
+                string=import_names[-1],
+                full_name=module_name,
+                sys_path=sys_path,
+                is_global_search=True,
+            )
+            if snapshot is not None:
+                snapshot.add(module_name, *result)
+        file_io_or_ns, is_pkg = result
         if is_pkg is None:
             return NO_VALUES
     else:
@@ -427,11 +435,11 @@ def import_module(inference_state, import_names, parent_module_value, sys_path):
             # not important to be correct.
             if not isinstance(path, list):
                 path = [path]
-            file_io_or_ns, is_pkg = inference_state.compiled_subprocess.get_module_info(
+            file_io_or_ns, is_pkg = _get_module_info(
+                inference_state,
                 string=import_names[-1],
                 path=path,
                 full_name=module_name,
-                is_global_search=False,
             )
             if is_pkg is not None:
                 break
@@ -463,6 +471,52 @@ def import_module(inference_state, import_names, parent_module_value, sys_path):
     return ValueSet([module])
 
 
+def _get_module_info(inference_state, string, path, full_name):
+    if len(path) == 1:
+        # Packages in zip archives are looked up in an index instead of
+        # asking the importer of the subprocess.
+        archive = get_archive_index(path[0])
+        if archive is not None:
+            index, folder = archive
+            result = index.find_module(folder, string)
+            if result is not None:
+                member_name, is_pkg = result
+                if member_name is not None:
+                    return ZipFileIO(
+                        index.get_path(member_name),
+                        index.read(member_name),
+                        Path(index.path),
+                    ), is_pkg
+                elif is_pkg:
+                    return ImplicitNSInfo(full_name, [os.path.join(path[0], string)]), True
+                return None, None
+
+    return inference_state.compiled_subprocess.get_module_info(
+        string=string,
+        path=path,
+        full_name=full_name,
+        is_global_search=False,
+    )
+
+
+def list_module_names(inference_state, paths):
+    """
+    Returns the names of the modules in the given folders.
+    """
+    names = []
+    other_paths = []
+    for path in paths:
+        archive = get_archive_index(path)
+        if archive is None:
+            other_paths.append(path)
+        else:
+            index, folder = archive
+            names += index.iter_module_names(folder)
+    if other_paths:
+        names += inference_state.compiled_subprocess.iter_module_names(other_paths)
+    return names
+
+
 def _load_python_module(inference_state, file_io,
                         import_names=None, is_package=False):
     module_node = inference_state.parse(
@@ -595,5 +649,5 @@ def iter_module_names(inference_state, module_context, search_path,
         for name in inference_state.compiled_subprocess.get_builtin_module_names():
             yield module_cls(module_context, name)
 
-    for name in inference_state.compiled_subprocess.iter_module_names(search_path):
+    for name in list_module_names(inference_state, search_path):
         yield module_cls(module_context, name)
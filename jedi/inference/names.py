@@ -26,6 +26,10 @@ def _merge_name_docs(names):
 
 
 class AbstractNameDefinition:
+    # Names are created in huge numbers, therefore all names in this module
+    # use __slots__.
+    __slots__ = ()
+
     start_pos: Optional[Tuple[int, int]] = None
     string_name: str
     parent_context = None
@@ -95,6 +99,8 @@ class AbstractArbitraryName(AbstractNameDefinition):
     string literals, which is not really a name, but for Jedi we use this
     concept of Name for completions as well.
     """
+    __slots__ = ('inference_state', 'string_name', 'parent_context')
+
     is_value_name = False
 
     def __init__(self, inference_state, string):
@@ -107,6 +113,8 @@ class AbstractArbitraryName(AbstractNameDefinition):
 
 
 class AbstractTreeName(AbstractNameDefinition):
+    __slots__ = ('parent_context', 'tree_name')
+
     def __init__(self, parent_context, tree_name):
         self.parent_context = parent_context
         self.tree_name = tree_name
@@ -226,6 +234,8 @@ class AbstractTreeName(AbstractNameDefinition):
 
 
 class ValueNameMixin:
+    __slots__ = ()
+
     def infer(self):
         return ValueSet([self._value])
 
@@ -258,6 +268,8 @@ class ValueNameMixin:
 
 
 class ValueName(ValueNameMixin, AbstractTreeName):
+    __slots__ = ('_value',)
+
     def __init__(self, value, tree_name):
         super().__init__(value.parent_context, tree_name)
         self._value = value
@@ -267,6 +279,8 @@ class ValueName(ValueNameMixin, AbstractTreeName):
 
 
 class TreeNameDefinition(AbstractTreeName):
+    __slots__ = ()
+
     _API_TYPES = dict(
         import_name='module',
         import_from='module',
@@ -355,6 +369,8 @@ class TreeNameDefinition(AbstractTreeName):
 
 
 class _ParamMixin:
+    __slots__ = ()
+
     def maybe_positional_argument(self, include_star=True):
         options = [Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD]
         if include_star:
@@ -380,6 +396,8 @@ class _ParamMixin:
 
 
 class ParamNameInterface(_ParamMixin):
+    __slots__ = ()
+
     api_type = 'param'
 
     def get_kind(self):
@@ -410,6 +428,8 @@ class ParamNameInterface(_ParamMixin):
 
 
 class BaseTreeParamName(ParamNameInterface, AbstractTreeName):
+    __slots__ = ()
+
     annotation_node = None
     default_node = None
 
@@ -436,6 +456,8 @@ class BaseTreeParamName(ParamNameInterface, AbstractTreeName):
 
 
 class _ActualTreeParamName(BaseTreeParamName):
+    __slots__ = ('function_value',)
+
     def __init__(self, function_value, tree_name):
         super().__init__(
             function_value.get_default_param_context(), tree_name)
@@ -505,6 +527,8 @@ class _ActualTreeParamName(BaseTreeParamName):
 
 
 class AnonymousParamName(_ActualTreeParamName):
+    __slots__ = ()
+
     @plugin_manager.decorate(name='goto_anonymous_param')
     def goto(self):
         return super().goto()
@@ -534,6 +558,8 @@ class AnonymousParamName(_ActualTreeParamName):
 
 
 class ParamName(_ActualTreeParamName):
+    __slots__ = ('arguments',)
+
     def __init__(self, function_value, tree_name, arguments):
         super().__init__(function_value, tree_name)
         self.arguments = arguments
@@ -563,6 +589,8 @@ class ParamNameWrapper(_ParamMixin):
 
 
 class ImportName(AbstractNameDefinition):
+    __slots__ = ('_from_module_context', 'string_name', '_memoize_method_dct')
+
     start_pos = (1, 0)
     _level = 0
 
@@ -609,6 +637,8 @@ class ImportName(AbstractNameDefinition):
 
 
 class SubModuleName(ImportName):
+    __slots__ = ()
+
     _level = 1
 
 
@@ -624,6 +654,8 @@ class NameWrapper:
 
 
 class StubNameMixin:
+    __slots__ = ()
+
     def py__doc__(self):
         from jedi.inference.gradual.conversion import convert_names
         # Stubs are not complicated and we can just follow simple statements
@@ -644,6 +676,8 @@ class StubNameMixin:
 
 # From here on down we make looking up the sys.version_info fast.
 class StubName(StubNameMixin, TreeNameDefinition):
+    __slots__ = ()
+
     def infer(self):
         inferred = super().infer()
         if self.string_name == 'version_info' and self.get_root_context().py__name__() == 'sys':
@@ -653,6 +687,8 @@ class StubName(StubNameMixin, TreeNameDefinition):
 
 
 class ModuleName(ValueNameMixin, AbstractNameDefinition):
+    __slots__ = ('_value', '_name')
+
     start_pos = 1, 0
 
     def __init__(self, value, name):
@@ -665,4 +701,4 @@ class ModuleName(ValueNameMixin, AbstractNameDefinition):
 
 
 class StubModuleName(StubNameMixin, ModuleName):
-    pass
+    __slots__ = ()
@@ -66,6 +66,8 @@ def execution_allowed(inference_state, node):
     if node in pushed_nodes:
         debug.warning('catched stmt recursion: %s @%s', node,
                       getattr(node, 'start_pos', None))
+        if inference_state.statistics is not None:
+            inference_state.statistics.recursion_limit_hits += 1
         yield False
     else:
         try:
@@ -82,6 +84,9 @@ def execution_recursion_decorator(default=NO_VALUES):
             limit_reached = detector.push_execution(self)
             try:
                 if limit_reached:
+                    statistics = self.inference_state.statistics
+                    if statistics is not None:
+                        statistics.recursion_limit_hits += 1
                     result = default
                 else:
                     result = func(self, **kwargs)
@@ -131,6 +136,9 @@ class ExecutionRecursionDetector:
             debug.warning('Function execution limit (%s) reached', total_function_execution_limit)
             return True
         self._execution_count += 1
+        statistics = self._inference_state.statistics
+        if statistics is not None:
+            statistics.function_executions += 1
 
         if self._funcdef_execution_counts.setdefault(funcdef, 0) >= per_function_execution_limit:
             if module_context.py__name__() == 'typing':
@@ -1,17 +1,27 @@
 import os
 import re
+import time
 
 from parso import python_bytes_to_unicode
 
 from jedi.debug import dbg
-from jedi.file_io import KnownContentFileIO, FolderIO
+from jedi.file_io import KnownContentFileIO, FolderIO, FileIO, get_stat
+from jedi.gitignore import get_gitignore, is_ignored
 from jedi.inference.names import SubModuleName
 from jedi.inference.imports import load_module_from_path
 from jedi.inference.filters import ParserTreeFilter
 from jedi.inference.gradual.conversion import convert_names
+from jedi.inference.cache import inference_state_function_cache
+from jedi.inference.import_graph import build_import_graph
 
 _IGNORE_FOLDERS = ('.tox', '.venv', '.mypy_cache', 'venv', '__pycache__')
 
+# File systems store modification times with a limited precision.
+_RACY_MODIFICATION_TIME_NS = 2 * 10 ** 9
+# Maps project paths to the walked folders, the module paths, their stat keys
+# and the import graph of the project.
+_import_graph_cache = {}
+
 _OPENED_FILE_LIMIT = 2000
 """
 Stats from a 2016 Lenovo Notebook running Linux:
@@ -24,6 +34,12 @@ _PARSED_FILE_LIMIT = 30
 For now we keep the amount of parsed files really low, since parsing might take
 easily 100ms for bigger files.
 """
+_PARSED_IMPORTER_LIMIT = 10 * _PARSED_FILE_LIMIT
+"""
+Modules that import a name are very likely to contain references, so more of
+them are parsed. There still needs to be a limit for names that are imported
+all over a big project.
+"""
 
 
 def _resolve_names(definition_names, avoid_names=()):
@@ -135,10 +151,15 @@ def find_references(module_context, tree_name, only_in_module=False):
     if only_in_module or any(n.api_type == 'param' for n in found_names):
         potential_modules = module_contexts
     else:
+        defining_module_contexts = None
+        if all(_is_only_used_by_importers(n) for n in found_names):
+            defining_module_contexts = {n.get_root_context() for n in found_names}
         potential_modules = get_module_contexts_containing_name(
             inf,
             module_contexts,
             search_name,
+            order_by_imports=True,
+            defining_module_contexts=defining_module_contexts,
         )
 
     non_matching_reference_maps = {}
@@ -165,7 +186,22 @@ def find_references(module_context, tree_name, only_in_module=False):
     return result
 
 
+def _is_only_used_by_importers(name):
+    """
+    Modules and names defined on module level can only be used by modules that
+    import them. Attributes and methods on the other hand reach other modules
+    through values (e.g. ``def f(obj): obj.method()``).
+    """
+    if name.api_type == 'module':
+        return True
+    if name.tree_name is None or name.tree_name.parent.type == 'trailer':
+        return False
+    return name.parent_context.is_module()
+
+
 def _check_fs(inference_state, file_io, regex):
+    if inference_state.statistics is not None:
+        inference_state.statistics.opened_files += 1
     try:
         code = file_io.read()
     except FileNotFoundError:
@@ -180,47 +216,35 @@ def _check_fs(inference_state, file_io, regex):
     return m.as_context()
 
 
-def gitignored_lines(folder_io, file_io):
-    ignored_paths = set()
-    ignored_names = set()
-    for l in file_io.read().splitlines():
-        if not l or l.startswith(b'#'):
-            continue
-
-        p = l.decode('utf-8', 'ignore')
-        if p.startswith('/'):
-            name = p[1:]
-            if name.endswith(os.path.sep):
-                name = name[:-1]
-            ignored_paths.add(os.path.join(folder_io.path, name))
-        else:
-            ignored_names.add(p)
-    return ignored_paths, ignored_names
-
-
 def recurse_find_python_folders_and_files(folder_io, except_paths=()):
-    except_paths = set(except_paths)
-    for root_folder_io, folder_ios, file_ios in folder_io.walk():
+    except_paths = {os.fspath(p) for p in except_paths if p is not None}
+    # The .gitignore files that apply to a folder, outermost first.
+    folder_gitignores = {}
+    for root, dir_names, file_names in folder_io.walk_names():
+        gitignores = folder_gitignores.pop(root, ())
+        if '.gitignore' in file_names:
+            gitignore = get_gitignore(root)
+            if gitignore is not None:
+                gitignores += ((root, gitignore),)
+
+        for name in file_names:
+            if name.endswith(('.py', '.pyi')):
+                path = os.path.join(root, name)
+                if path not in except_paths \
+                        and not is_ignored(gitignores, path, is_dir=False):
+                    yield None, FileIO(path)
+
         # Delete folders that we don't want to iterate over.
-        for file_io in file_ios:
-            path = file_io.path
-            if path.suffix in ('.py', '.pyi'):
-                if path not in except_paths:
-                    yield None, file_io
-
-            if path.name == '.gitignore':
-                ignored_paths, ignored_names = \
-                    gitignored_lines(root_folder_io, file_io)
-                except_paths |= ignored_paths
-
-        folder_ios[:] = [
-            folder_io
-            for folder_io in folder_ios
-            if folder_io.path not in except_paths
-            and folder_io.get_base_name() not in _IGNORE_FOLDERS
-        ]
-        for folder_io in folder_ios:
-            yield folder_io, None
+        walked_names = []
+        for name in dir_names:
+            path = os.path.join(root, name)
+            if name in _IGNORE_FOLDERS or path in except_paths \
+                    or is_ignored(gitignores, path, is_dir=True):
+                continue
+            walked_names.append(name)
+            folder_gitignores[path] = gitignores
+            yield FolderIO(path), None
+        dir_names[:] = walked_names
 
 
 def recurse_find_python_files(folder_io, except_paths=()):
@@ -250,18 +274,115 @@ def _find_python_files_in_sys_path(inference_state, module_contexts):
             folder_io = folder_io.get_parent_folder()
 
 
-def _find_project_modules(inference_state, module_contexts):
+@inference_state_function_cache()
+def get_project_import_graph(inference_state):
+    """
+    The graph is shared by the inference states of a project. The project is
+    only walked again if a folder changed and the graph is only built again if
+    a module was added, removed or changed.
+    """
+    project_path = os.fspath(inference_state.project.path)
+    folders, paths, file_keys, graph = _import_graph_cache.get(
+        project_path, (None, None, None, None))
+    new_paths = paths
+    if folders is None or any(_get_folder_key(p) != k for p, k in folders):
+        folders, new_paths = _walk_project(project_path)
+
+    new_file_keys = [_get_file_key(p) for p in new_paths]
+    if new_paths != paths or new_file_keys != file_keys:
+        graph = build_import_graph(new_paths)
+    racy_time = time.time_ns() - _RACY_MODIFICATION_TIME_NS
+    if any(k[0] is not None and k[0] >= racy_time for _, k in folders):
+        # A folder that was changed just now might change again without a
+        # visible difference, it needs to be walked again.
+        folders = None
+    _import_graph_cache[project_path] = folders, new_paths, new_file_keys, graph
+    return graph
+
+
+def _walk_project(project_path):
+    folders = [project_path]
+    paths = []
+    for folder_io, file_io in recurse_find_python_folders_and_files(FolderIO(project_path)):
+        if folder_io is None:
+            paths.append(file_io.path)
+        else:
+            folders.append(folder_io.path)
+    return [(p, _get_folder_key(p)) for p in folders], paths
+
+
+def _get_folder_key(path):
+    # Adding or removing files changes the modification time of a folder.
+    # Changing a .gitignore doesn't, but it changes which files are walked.
+    return (
+        _get_modification_time(path),
+        _get_modification_time(os.path.join(path, '.gitignore')),
+    )
+
+
+def _get_file_key(path):
+    stat = get_stat(path)
+    return None if stat is None else (stat.st_mtime_ns, stat.st_size)
+
+
+def _get_modification_time(path):
+    stat = get_stat(path)
+    return None if stat is None else stat.st_mtime_ns
+
+
+def _find_project_modules(inference_state, module_contexts, order_by_imports):
     except_ = [m.py__file__() for m in module_contexts]
-    yield from recurse_find_python_files(FolderIO(inference_state.project.path), except_)
+    if not order_by_imports:
+        yield from recurse_find_python_files(FolderIO(inference_state.project.path), except_)
+        return
+
+    graph = get_project_import_graph(inference_state)
+    # Modules that import the modules of the name are searched first, because
+    # they are the most likely to use it.
+    except_paths = {os.fspath(p) for p in except_ if p is not None}
+    for path in graph.sort_by_reachability(except_paths):
+        if path not in except_paths:
+            yield FileIO(path)
+
+
+def _find_importing_project_modules(inference_state, module_contexts,
+                                    defining_module_contexts):
+    """
+    Returns the modules that import the defining modules (directly or
+    indirectly) or None if a defining module is not part of the project.
+    """
+    graph = get_project_import_graph(inference_state)
+    defining_paths = []
+    for module_context in defining_module_contexts:
+        path = module_context.py__file__()
+        if path is None or path not in graph:
+            return None
+        defining_paths.append(path)
+
+    distances = graph.get_importer_distances(defining_paths)
+    except_paths = {os.fspath(m.py__file__()) for m in module_contexts
+                    if m.py__file__() is not None}
+    return [
+        FileIO(path)
+        for path in sorted(distances, key=distances.get)
+        if path not in except_paths
+    ]
 
 
 def get_module_contexts_containing_name(inference_state, module_contexts, name,
-                                        limit_reduction=1):
+                                        limit_reduction=1, order_by_imports=False,
+                                        defining_module_contexts=None):
     """
     Search a name in the directories of modules.
 
     :param limit_reduction: Divides the limits on opening/parsing files by this
         factor.
+    :param order_by_imports: Search the modules that import the given modules
+        first. This needs the import graph of the whole project.
+    :param defining_module_contexts: The modules that define the name, only
+        pass them if the name needs to be imported to be used. If they are all
+        part of the project, only the modules that import them are searched.
+        More of those are parsed, see ``_PARSED_IMPORTER_LIMIT``.
     """
     # Skip non python modules
     for module_context in module_contexts:
@@ -274,17 +395,37 @@ def get_module_contexts_containing_name(inference_state, module_contexts, name,
     if len(name) <= 2:
         return
 
+    if defining_module_contexts is not None:
+        file_ios = _find_importing_project_modules(
+            inference_state, module_contexts, defining_module_contexts)
+        if file_ios is not None:
+            yield from search_in_file_ios(
+                inference_state, file_ios, name,
+                limit_reduction=limit_reduction,
+                parse_limit=_PARSED_IMPORTER_LIMIT,
+            )
+            return
+
     # Currently not used, because there's only `scope=project` and `scope=file`
     # At the moment there is no such thing as `scope=sys.path`.
     # file_io_iterator = _find_python_files_in_sys_path(inference_state, module_contexts)
-    file_io_iterator = _find_project_modules(inference_state, module_contexts)
+    file_io_iterator = _find_project_modules(inference_state, module_contexts,
+                                             order_by_imports)
     yield from search_in_file_ios(inference_state, file_io_iterator, name,
                                   limit_reduction=limit_reduction)
 
 
 def search_in_file_ios(inference_state, file_io_iterator, name,
-                       limit_reduction=1, complete=False):
-    parse_limit = _PARSED_FILE_LIMIT / limit_reduction
+                       limit_reduction=1, complete=False,
+                       parse_limit=None):
+    """
+    :param parse_limit: The maximum amount of files that are parsed, before
+        it is divided by ``limit_reduction``. Defaults to
+        ``_PARSED_FILE_LIMIT``.
+    """
+    if parse_limit is None:
+        parse_limit = _PARSED_FILE_LIMIT
+    parse_limit /= limit_reduction
     open_limit = _OPENED_FILE_LIMIT / limit_reduction
     file_io_count = 0
     parsed_file_count = 0
@@ -0,0 +1,212 @@
+"""
+Top level imports are found by the importer of the subprocess, which also
+sends the code of a module back. For every new Script this has to be done
+again for every import.
+
+The results only depend on the environment and on the folders of the sys
+path. They are therefore shared by all inference states with the same
+environment and sys path in an :class:`ImportSnapshot`. Snapshots are stored
+in :data:`jedi.settings.cache_directory`, so a restarted process doesn't need
+to find the imports again. Parsed modules are already cached there by parso.
+A snapshot is stored after a few new imports and when another inference state
+starts to use it. Only the most recently used snapshots are kept.
+
+A snapshot is not used anymore, once the environment or one of the folders
+on the sys path changes.
+"""
+import hashlib
+import json
+import os
+import time
+from contextlib import suppress
+
+from jedi import settings
+from jedi.file_io import FileIO, ZipFileIO, get_stat
+from jedi.inference.cache import inference_state_function_cache
+from jedi.inference.compiled.subprocess import InferenceStateSameProcess
+from jedi.inference.compiled.subprocess.functions import ImplicitNSInfo
+
+_SNAPSHOT_VERSION = 2
+# File systems store modification times with a limited precision, folders
+# that changed recently might change again without a visible difference.
+_RACY_MODIFICATION_TIME_NS = 2 * 10 ** 9
+# A snapshot is stored once it has this many new imports.
+_SAVE_INTERVAL = 20
+# Every project has its own sys path and therefore its own snapshot.
+_MAX_SNAPSHOT_FILES = 20
+
+# Maps snapshot keys to loaded snapshots.
+_snapshots = {}
+
+
+class ImportSnapshot:
+    def __init__(self, key, environment_key, folders, modules=None):
+        self.key = key
+        self._environment_key = environment_key
+        self._folders = folders
+        self._modules = {} if modules is None else modules
+        self._unsaved_count = 0
+
+    def is_valid(self, environment_key):
+        return self._environment_key == environment_key and all(
+            _get_modification_time(p) == t for p, t in self._folders
+        )
+
+    def get(self, full_name):
+        """
+        Returns the result of ``get_module_info`` for a top level import or
+        None if it is not known.
+        """
+        try:
+            kind, value, is_package = self._modules[full_name]
+        except KeyError:
+            return None
+        if kind == 'namespace':
+            if any(get_stat(os.path.join(p, '__init__.py')) for p in value):
+                # The namespace became a package.
+                return None
+            return ImplicitNSInfo(full_name, value), is_package
+        if kind == 'file':
+            if get_stat(value) is None:
+                return None
+            return FileIO(value), is_package
+        return None, is_package
+
+    def add(self, full_name, file_io_or_ns, is_package):
+        if is_package is None:
+            # Modules that don't exist are not stored, these are usually
+            # typos.
+            return
+        if isinstance(file_io_or_ns, ImplicitNSInfo):
+            entry = 'namespace', list(file_io_or_ns.paths), is_package
+        elif file_io_or_ns is None:
+            entry = 'builtin', None, is_package
+        elif isinstance(file_io_or_ns, ZipFileIO):
+            # Modules in zip archives need their code.
+            return
+        else:
+            entry = 'file', os.fspath(file_io_or_ns.path), is_package
+        self._modules[full_name] = entry
+        self._unsaved_count += 1
+        if self._unsaved_count >= _SAVE_INTERVAL:
+            self.save()
+
+    def save(self):
+        if not self._unsaved_count:
+            return
+        data = dict(
+            version=_SNAPSHOT_VERSION,
+            environment_key=self._environment_key,
+            folders=self._folders,
+            modules=self._modules,
+        )
+        # The cache directory is looked up now, it might have been changed
+        # since the snapshot was created.
+        folder = _get_snapshot_folder()
+        path = os.path.join(folder, self.key + '.json')
+        with suppress(OSError):
+            os.makedirs(folder, exist_ok=True)
+            tmp_path = '%s.%s' % (path, os.getpid())
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+            _remove_old_snapshots(folder)
+        self._unsaved_count = 0
+
+
+def get_import_snapshot(inference_state, sys_path):
+    if isinstance(inference_state.compiled_subprocess, InferenceStateSameProcess):
+        # In the same process sys.path and sys.modules can be modified.
+        return None
+    return _get_import_snapshot(inference_state, tuple(sys_path))
+
+
+@inference_state_function_cache()
+def _get_import_snapshot(inference_state, sys_path):
+    environment_key = _get_environment_key(inference_state.environment)
+    key = _get_snapshot_key(inference_state.environment.executable, sys_path)
+
+    snapshot = _snapshots.get(key)
+    if snapshot is None:
+        snapshot = _load_snapshot(key)
+    else:
+        # A new inference state uses the snapshot, the imports of the ones
+        # before are probably complete.
+        snapshot.save()
+    if snapshot is not None and snapshot.is_valid(environment_key):
+        _snapshots[key] = snapshot
+        return snapshot
+
+    folders = [(p, _get_modification_time(p)) for p in sys_path]
+    racy_time = time.time_ns() - _RACY_MODIFICATION_TIME_NS
+    if any(t is not None and t >= racy_time for _, t in folders):
+        _snapshots.pop(key, None)
+        return None
+    snapshot = _snapshots[key] = ImportSnapshot(key, environment_key, folders)
+    return snapshot
+
+
+def _get_environment_key(environment):
+    """
+    Replacing or upgrading the executable of an environment changes its key.
+    """
+    real_path = os.path.realpath(environment.executable)
+    stat = get_stat(real_path)
+    if stat is None:
+        return None
+    return [real_path, stat.st_mtime_ns, stat.st_size]
+
+
+def _get_snapshot_key(executable, sys_path):
+    key = json.dumps([executable, sys_path]).encode('utf-8')
+    return hashlib.sha256(key).hexdigest()
+
+
+def _get_snapshot_folder():
+    return os.path.join(settings.cache_directory, 'import_snapshots')
+
+
+def _load_snapshot(key):
+    path = os.path.join(_get_snapshot_folder(), key + '.json')
+    try:
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        if data['version'] != _SNAPSHOT_VERSION:
+            return None
+        snapshot = ImportSnapshot(
+            key,
+            data['environment_key'],
+            [tuple(x) for x in data['folders']],
+            {name: tuple(entry) for name, entry in data['modules'].items()},
+        )
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    # The modification time tells which snapshots were used recently.
+    with suppress(OSError):
+        os.utime(path)
+    return snapshot
+
+
+def _remove_old_snapshots(folder):
+    snapshots = []
+    for entry in os.scandir(folder):
+        if entry.name.endswith('.json'):
+            with suppress(OSError):
+                snapshots.append((entry.stat().st_mtime_ns, entry.path))
+    snapshots.sort(reverse=True)
+    for _, path in snapshots[_MAX_SNAPSHOT_FILES:]:
+        with suppress(OSError):
+            os.remove(path)
+
+
+def _get_modification_time(path):
+    stat = get_stat(path)
+    return None if stat is None else stat.st_mtime_ns
+
+
+def save_import_snapshots():
+    """
+    Stores the new imports of all snapshots.
+    """
+    for snapshot in _snapshots.values():
+        snapshot.save()
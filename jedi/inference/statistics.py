@@ -0,0 +1,97 @@
+"""
+Statistics about the work |jedi| did while answering a single API call.
+
+Collecting them is opt-in, see :data:`jedi.settings.collect_statistics`. When
+enabled, every :class:`.Script` method resets the counters before it starts
+working, so after e.g. :meth:`.Script.complete` returned,
+:attr:`.Script.statistics` describes exactly that call. The first call on a
+:class:`.Script` also includes the parsing that happened during its creation.
+"""
+import time
+from contextlib import contextmanager
+
+from jedi.inference import recursion
+
+
+class InferenceStatistics:
+    def __init__(self):
+        self._request_depth = 0
+        self._finished_requests = 0
+        self.reset()
+
+    def reset(self):
+        #: How many times :meth:`.InferenceState.execute` was called.
+        self.execute_calls = 0
+        #: Non-builtin function executions that count towards
+        #: :data:`jedi.inference.recursion.total_function_execution_limit`.
+        self.function_executions = 0
+        #: How many times any of the recursion/execution limits stopped
+        #: inference.
+        self.recursion_limit_hits = 0
+        #: How many modules were handed to the parser.
+        self.parsed_modules = 0
+        #: How many files were read while searching for references/names.
+        self.opened_files = 0
+        #: Round-trips to the environment subprocess.
+        self.subprocess_calls = 0
+        #: Wall time in seconds per phase (e.g. ``parse`` or ``complete``).
+        self.phase_times = {}
+
+    @property
+    def function_execution_limit(self):
+        return recursion.total_function_execution_limit
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phase_times[name] = \
+                self.phase_times.get(name, 0.0) + time.perf_counter() - start
+
+    @contextmanager
+    def request(self, name):
+        """
+        Used for API calls. Nested calls (e.g. :meth:`.Script.help` calling
+        :meth:`.Script.goto`) are accounted to the outermost call.
+        """
+        if self._request_depth == 0 and self._finished_requests:
+            self.reset()
+        self._request_depth += 1
+        try:
+            with self.phase(name):
+                yield
+        finally:
+            self._request_depth -= 1
+            if self._request_depth == 0:
+                self._finished_requests += 1
+
+    def as_dict(self):
+        return dict(
+            execute_calls=self.execute_calls,
+            function_executions=self.function_executions,
+            function_execution_limit=self.function_execution_limit,
+            recursion_limit_hits=self.recursion_limit_hits,
+            parsed_modules=self.parsed_modules,
+            opened_files=self.opened_files,
+            subprocess_calls=self.subprocess_calls,
+            phase_times=dict(self.phase_times),
+        )
+
+    def __repr__(self):
+        return '<%s: %s>' % (
+            self.__class__.__name__,
+            ', '.join('%s=%r' % item for item in self.as_dict().items()),
+        )
+
+
+@contextmanager
+def record_phase(inference_state, name):
+    """Times ``name`` if statistics are collected, otherwise does nothing."""
+    statistics = inference_state.statistics
+    if statistics is None:
+        yield
+    else:
+        with statistics.phase(name):
+            yield
@@ -332,7 +332,8 @@ class BaseFunctionExecutionContext(ValueContext, TreeContextMixin):
                 # The contravariant doesn't seem to be defined.
                 generics = (yield_values.py__class__(), NO_VALUES)
                 return ValueSet(
-                    GenericClass(c, TupleGenericManager(generics))
+                    GenericClass.create_cached(
+                        inference_state, c, TupleGenericManager(generics))
                     for c in async_generator_classes
                 ).execute_annotation()
             else:
@@ -341,7 +342,9 @@ class BaseFunctionExecutionContext(ValueContext, TreeContextMixin):
                 # Only the first generic is relevant.
                 generics = (return_values.py__class__(), NO_VALUES, NO_VALUES)
                 return ValueSet(
-                    GenericClass(c, TupleGenericManager(generics)) for c in async_classes
+                    GenericClass.create_cached(
+                        inference_state, c, TupleGenericManager(generics))
+                    for c in async_classes
                 ).execute_annotation()
         else:
             if self.is_generator():
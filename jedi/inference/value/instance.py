@@ -24,6 +24,8 @@ from jedi.parser_utils import function_is_staticmethod, function_is_classmethod
 
 
 class InstanceExecutedParamName(ParamName):
+    __slots__ = ('_instance',)
+
     def __init__(self, instance, function_value, tree_name):
         super().__init__(
             function_value, tree_name, arguments=None)
@@ -485,6 +487,8 @@ class SelfName(TreeNameDefinition):
     """
     This name calculates the parent_context lazily.
     """
+    __slots__ = ('_instance', 'class_context')
+
     def __init__(self, instance, class_context, tree_name):
         self._instance = instance
         self.class_context = class_context
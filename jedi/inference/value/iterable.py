@@ -198,7 +198,8 @@ class Sequence(LazyAttributeOverwrite, IterableMixin):
         from jedi.inference.gradual.base import GenericClass
         from jedi.inference.gradual.generics import TupleGenericManager
         klass = compiled.builtin_from_name(self.inference_state, self.array_type)
-        c, = GenericClass(
+        c, = GenericClass.create_cached(
+            self.inference_state,
             klass,
             TupleGenericManager(self._cached_generics())
         ).execute_annotation()
@@ -55,6 +55,8 @@ from jedi.plugins import plugin_manager
 
 
 class ClassName(TreeNameDefinition):
+    __slots__ = ('_apply_decorators', '_class_value')
+
     def __init__(self, class_value, tree_name, name_context, apply_decorators):
         super().__init__(name_context, tree_name)
         self._apply_decorators = apply_decorators
@@ -291,7 +293,8 @@ class ClassMixin:
             debug.warning('Class indexes inferred to nothing. Returning class instead')
             return ValueSet([self])
         return ValueSet(
-            GenericClass(
+            GenericClass.create_cached(
+                self.inference_state,
                 self,
                 LazyGenericManager(
                     context_of_index=contextualized_node.context,
@@ -303,7 +306,8 @@ class ClassMixin:
 
     def with_generics(self, generics_tuple):
         from jedi.inference.gradual.base import GenericClass
-        return GenericClass(
+        return GenericClass.create_cached(
+            self.inference_state,
             self,
             TupleGenericManager(generics_tuple)
         )
@@ -325,7 +329,8 @@ class ClassMixin:
                 yield type_var_dict.get(type_var.py__name__(), NO_VALUES)
 
         if type_var_dict:
-            return ValueSet([GenericClass(
+            return ValueSet([GenericClass.create_cached(
+                self.inference_state,
                 self,
                 TupleGenericManager(tuple(remap_type_vars()))
             )])
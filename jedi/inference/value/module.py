@@ -41,11 +41,10 @@ class SubModuleDictMixin:
         Lists modules in the directory of this module (if this module is a
         package).
         """
+        from jedi.inference.imports import list_module_names
         names = {}
         if self.is_package():
-            mods = self.inference_state.compiled_subprocess.iter_module_names(
-                self.py__path__()
-            )
+            mods = list_module_names(self.inference_state, self.py__path__())
             for name in mods:
                 # It's obviously a relative import to the current module.
                 names[name] = SubModuleName(self.as_context(), name)
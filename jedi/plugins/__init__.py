@@ -1,3 +1,5 @@
+import time
+from contextlib import contextmanager
 from functools import wraps
 
 
@@ -6,6 +8,7 @@ class _PluginManager:
         self._registered_plugins = []
         self._cached_base_callbacks = {}
         self._built_functions = {}
+        self._profile = None
 
     def register(self, *plugins):
         """
@@ -18,19 +21,42 @@ class _PluginManager:
         def decorator(callback):
             @wraps(callback)
             def wrapper(*args, **kwargs):
-                return built_functions[public_name](*args, **kwargs)
+                return built_function[0](*args, **kwargs)
 
             public_name = name or callback.__name__
 
             assert public_name not in self._built_functions
-            built_functions = self._built_functions
-            built_functions[public_name] = callback
+            # The hooks are called very often, a list is used so the built
+            # function doesn't have to be looked up by name for every call.
+            built_function = self._built_functions[public_name] = [callback]
             self._cached_base_callbacks[public_name] = callback
 
             return wrapper
 
         return decorator
 
+    @contextmanager
+    def profile(self):
+        """
+        Counts the calls of the hooks of every plugin and measures the time
+        spent in them while the context manager is active::
+
+            with plugin_manager.profile() as profile:
+                script.complete()
+            print(profile.as_dict())
+
+        Plugins are only wrapped with measuring code while profiling.
+        """
+        if self._profile is not None:
+            raise RuntimeError("Plugins are already being profiled")
+        self._profile = profile = PluginProfile()
+        self._build_functions()
+        try:
+            yield profile
+        finally:
+            self._profile = None
+            self._build_functions()
+
     def _build_functions(self):
         for name, callback in self._cached_base_callbacks.items():
             for plugin in reversed(self._registered_plugins):
@@ -40,8 +66,66 @@ class _PluginManager:
                 except AttributeError:
                     pass
                 else:
-                    callback = func(callback)
-            self._built_functions[name] = callback
+                    if self._profile is None:
+                        callback = func(callback)
+                    else:
+                        callback = self._profile.wrap(plugin, name, func, callback)
+            # Hooks that no plugin implements call the original function
+            # directly.
+            self._built_functions[name][0] = callback
+
+
+class PluginProfile:
+    """
+    The calls and the time of each hook of each plugin. The time of a hook
+    does not include the time spent in the callbacks it calls or in other
+    hooks it triggers, so it's the overhead a plugin adds.
+    """
+    def __init__(self):
+        #: ``(plugin name, hook name)`` mapped to the number of calls.
+        self.calls = {}
+        #: ``(plugin name, hook name)`` mapped to seconds.
+        self.times = {}
+        # Time spent in nested calls, per active call.
+        self._stack = []
+
+    def wrap(self, plugin, hook_name, func, callback):
+        key = (getattr(plugin, '__name__', repr(plugin)), hook_name)
+        self.calls.setdefault(key, 0)
+        self.times.setdefault(key, 0.0)
+
+        def timed_callback(*args, **kwargs):
+            return self._call(None, callback, args, kwargs)
+
+        plugin_function = func(timed_callback)
+
+        def wrapper(*args, **kwargs):
+            return self._call(key, plugin_function, args, kwargs)
+        return wrapper
+
+    def _call(self, key, func, args, kwargs):
+        stack = self._stack
+        stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            nested = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            if key is not None:
+                self.calls[key] += 1
+                self.times[key] += elapsed - nested
+
+    def as_dict(self):
+        return {
+            '%s.%s' % key: dict(calls=calls, time=self.times[key])
+            for key, calls in self.calls.items()
+        }
+
+    def __repr__(self):
+        return '<%s: %s>' % (self.__class__.__name__, self.as_dict())
 
 
 plugin_manager = _PluginManager()
@@ -4,8 +4,10 @@ Module is used to infer Django model fields.
 from inspect import Parameter
 
 from jedi import debug
-from jedi.inference.cache import inference_state_function_cache
-from jedi.inference.base_value import ValueSet, iterator_to_value_set, ValueWrapper
+from jedi.inference.cache import inference_state_function_cache, \
+    inference_state_method_cache
+from jedi.inference.base_value import ValueSet, NO_VALUES, iterator_to_value_set, \
+    ValueWrapper
 from jedi.inference.filters import DictFilter, AttributeOverwrite
 from jedi.inference.names import NameWrapper, BaseTreeParamName
 from jedi.inference.compiled.value import EmptyCompiledName
@@ -84,6 +86,7 @@ def _get_foreign_key_values(cls, field_tree_instance):
                     yield value
 
 
+@inference_state_method_cache(default=NO_VALUES)
 def _infer_field(cls, field_name, is_instance):
     inference_state = cls.inference_state
     result = field_name.infer()
@@ -122,6 +125,7 @@ class DjangoModelName(NameWrapper):
         return _infer_field(self._cls, self._wrapped_name, self._is_instance)
 
 
+@inference_state_method_cache()
 def _create_manager_for(cls, manager_cls='BaseManager'):
     managers = cls.inference_state.import_module(
         ('django', 'db', 'models', 'manager')
@@ -129,12 +133,23 @@ def _create_manager_for(cls, manager_cls='BaseManager'):
     for m in managers:
         if m.is_class_mixin():
             generics_manager = TupleGenericManager((ValueSet([cls]),))
-            for c in GenericClass(m, generics_manager).execute_annotation():
+            generic_class = GenericClass.create_cached(
+                cls.inference_state, m, generics_manager)
+            for c in generic_class.execute_annotation():
                 return c
     return None
 
 
 def _new_dict_filter(cls, is_instance):
+    return DictFilter(_get_model_names(cls, is_instance))
+
+
+@inference_state_method_cache()
+def _get_model_names(cls, is_instance):
+    """
+    The attributes of a model, built once per model class. Fields are
+    wrapped, so that they infer to the type of their values.
+    """
     filters = list(cls.get_filters(
         is_instance=is_instance,
         include_metaclasses=False,
@@ -153,8 +168,7 @@ def _new_dict_filter(cls, is_instance):
         # show up in completions, but it's probably just not worth doing that
         # for the extra amount of work.
         dct['objects'] = EmptyCompiledName(cls.inference_state, 'objects')
-
-    return DictFilter(dct)
+    return dct
 
 
 def is_django_model_base(value):
@@ -200,12 +214,15 @@ def tree_name_to_values(func):
     return wrapper
 
 
+@inference_state_method_cache()
 def _find_fields(cls):
-    for name in _new_dict_filter(cls, is_instance=False).values():
+    fields = []
+    for name in _get_model_names(cls, False).values():
         for value in name.infer():
             if value.name.get_qualified_names(include_module_names=True) \
                     == ('django', 'db', 'models', 'query_utils', 'DeferredAttribute'):
-                yield name
+                fields.append(name)
+    return fields
 
 
 def _get_signatures(cls):
@@ -1,7 +1,9 @@
 from pathlib import Path
 
 from parso.tree import search_ancestor
-from jedi.inference.cache import inference_state_method_cache
+from jedi.file_io import FolderIO
+from jedi.inference.cache import inference_state_method_cache, \
+    inference_state_function_cache
 from jedi.inference.imports import load_module_from_path
 from jedi.inference.filters import ParserTreeFilter
 from jedi.inference.base_value import NO_VALUES, ValueSet
@@ -84,9 +86,9 @@ def complete_param_names(func):
     def wrapper(context, func_name, decorator_nodes):
         module_context = context.get_root_context()
         if _is_pytest_func(func_name, decorator_nodes):
-            names = []
-            for module_context in _iter_pytest_modules(module_context):
-                names += FixtureFilter(module_context).values()
+            names = [n for names in _get_module_fixtures(module_context).values()
+                     for n in names]
+            names += _get_fixture_index_for_module(module_context).values()
             if names:
                 return names
         return func(context, func_name, decorator_nodes)
@@ -94,10 +96,11 @@ def complete_param_names(func):
 
 
 def _goto_pytest_fixture(module_context, name, skip_own_module):
-    for module_context in _iter_pytest_modules(module_context, skip_own_module=skip_own_module):
-        names = FixtureFilter(module_context).get(name)
+    if not skip_own_module:
+        names = _get_module_fixtures(module_context).get(name)
         if names:
-            return names
+            return list(names)
+    return _get_fixture_index_for_module(module_context).get(name)
 
 
 def _is_a_pytest_param_and_inherited(param_name):
@@ -120,27 +123,50 @@ def _is_pytest_func(func_name, decorator_nodes):
         or any('fixture' in n.get_code() for n in decorator_nodes)
 
 
-@inference_state_method_cache()
-def _iter_pytest_modules(module_context, skip_own_module=False):
-    if not skip_own_module:
-        yield module_context
-
+def _get_fixture_index_for_module(module_context):
+    """
+    Returns the fixtures a module inherits from conftest files and pytest
+    itself. A conftest module doesn't inherit from itself.
+    """
     file_io = module_context.get_value().file_io
-    if file_io is not None:
+    if file_io is None:
+        folder_path = None
+    else:
         folder = file_io.get_parent_folder()
-        sys_path = module_context.inference_state.get_sys_path()
+        if Path(file_io.path) == Path(folder.get_file_io('conftest.py').path):
+            folder = folder.get_parent_folder()
+        folder_path = folder.path
+    return _get_fixture_index(module_context.inference_state, folder_path)
+
+
+@inference_state_function_cache()
+def _get_fixture_index(inference_state, folder_path):
+    """
+    All the fixtures that are available in a folder, built from the
+    ``conftest.py`` files in it and its parents and from the pytest modules
+    that define fixtures.
+    """
+    index = _FixtureIndex()
+    for module_context in _iter_fixture_modules(inference_state, folder_path):
+        index.add(_get_module_fixtures(module_context))
+    return index
+
+
+def _iter_fixture_modules(inference_state, folder_path):
+    if folder_path is not None:
+        folder = FolderIO(folder_path)
+        sys_path = inference_state.get_sys_path()
 
         # prevent an infinite loop when reaching the root of the current drive
         last_folder = None
 
         while any(folder.path.startswith(p) for p in sys_path):
             file_io = folder.get_file_io('conftest.py')
-            if Path(file_io.path) != module_context.py__file__():
-                try:
-                    m = load_module_from_path(module_context.inference_state, file_io)
-                    yield m.as_context()
-                except FileNotFoundError:
-                    pass
+            try:
+                m = load_module_from_path(inference_state, file_io)
+                yield m.as_context()
+            except FileNotFoundError:
+                pass
             folder = folder.get_parent_folder()
 
             # prevent an infinite for loop if the same parent folder is return twice
@@ -149,10 +175,39 @@ def _iter_pytest_modules(module_context, skip_own_module=False):
             last_folder = folder  # keep track of the last found parent name
 
     for names in _PYTEST_FIXTURE_MODULES:
-        for module_value in module_context.inference_state.import_module(names):
+        for module_value in inference_state.import_module(names):
             yield module_value.as_context()
 
 
+class _FixtureIndex:
+    """
+    Fixture names mapped to their definitions. Closer definitions shadow the
+    ones further away, like in pytest.
+    """
+    def __init__(self):
+        self._names = {}
+        self._all_names = []
+
+    def add(self, fixtures):
+        for string_name, names in fixtures.items():
+            self._names.setdefault(string_name, names)
+            self._all_names += names
+
+    def get(self, string_name):
+        return list(self._names.get(string_name, []))
+
+    def values(self):
+        return list(self._all_names)
+
+
+@inference_state_method_cache()
+def _get_module_fixtures(module_context):
+    """
+    Returns a dict of fixture names to their definitions in a module.
+    """
+    return FixtureFilter(module_context).get_fixtures()
+
+
 class FixtureFilter(ParserTreeFilter):
     def _filter(self, names):
         for name in super()._filter(names):
@@ -163,6 +218,12 @@ class FixtureFilter(ParserTreeFilter):
                 if decorated.type == 'decorated' and self._is_fixture(decorated):
                     yield name
 
+    def get_fixtures(self):
+        fixtures = {}
+        for name in self.values():
+            fixtures.setdefault(name.string_name, []).append(name)
+        return fixtures
+
     def _is_fixture(self, decorated):
         decorators = decorated.children[0]
         if decorators.type == 'decorators':
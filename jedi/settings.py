@@ -29,6 +29,7 @@ Parser
 ~~~~~~
 
 .. autodata:: fast_parser
+.. autodata:: docstring_parser
 
 
 Dynamic stuff
@@ -44,6 +45,15 @@ Caching
 ~~~~~~~
 
 .. autodata:: call_signatures_validity
+.. autodata:: completions_validity
+.. autodata:: sys_path_validity
+.. autodata:: file_change_notifications
+
+
+Statistics
+~~~~~~~~~~
+
+.. autodata:: collect_statistics
 
 
 """
@@ -101,6 +111,14 @@ parse the parts again that have changed, while reusing the rest of the syntax
 tree.
 """
 
+docstring_parser = 'auto'
+"""
+How NumPy style docstrings are parsed for types. ``'builtin'`` uses Jedi's
+own (fast) parser, ``'numpydoc'`` uses the ``numpydoc`` package. ``'auto'``
+uses ``numpydoc`` if it is installed and the builtin parser otherwise. Sphinx,
+Epydoc and Google style docstrings are always parsed by Jedi itself.
+"""
+
 _cropped_file_size = int(10e6)  # 1 Megabyte
 """
 Jedi gets extremely slow if the file size exceed a few thousand lines.
@@ -152,3 +170,38 @@ call_signatures_validity = 3.0
 Finding function calls might be slow (0.1-0.5s). This is not acceptible for
 normal writing. Therefore cache it for a short time.
 """
+
+completions_validity = 3.0
+"""
+Completing attributes like ``numpy.ar`` infers ``numpy`` and lists all its
+names. While the user types the rest of the name, the code before it doesn't
+change, so these names are cached for a short time and just filtered again.
+"""
+
+sys_path_validity = 10.0
+"""
+The sys path of a project is needed for every Script. Calculating it means
+asking the environment and looking for ``__init__.py`` and buildout files in
+the parent folders of the script, so it is cached per project, environment and
+folder for a short time.
+"""
+
+file_change_notifications = False
+"""
+Jedi checks the modification times of files and folders all the time to know
+whether its caches are still valid. If the host watches the file system and
+calls :func:`jedi.notify_changed` for every change, this can be enabled and
+Jedi only checks every path once.
+"""
+
+# ----------------
+# Statistics
+# ----------------
+
+collect_statistics = False
+"""
+Collect statistics (function executions, parsed modules, subprocess calls,
+timings) for every API call. They are available as
+:attr:`jedi.Script.statistics` afterwards. This is off by default, because
+counting has a small cost in hot code paths.
+"""
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+"""
+Measure the memory Jedi allocates while completing in a (large) module.
+
+Completions are requested at the end of every n-th line of the file. The
+allocation peak is measured with ``tracemalloc``. Afterwards the instances of
+the classes Jedi creates most often are counted, together with their size and
+whether they carry a ``__dict__``. Run this on two revisions to compare them.
+
+Usage:
+  completion_memory.py [<file>] [-n <number>]
+  completion_memory.py -h | --help
+
+Options:
+  -h --help     Show this screen.
+  -n <number>   Complete at every n-th line [default: 25].
+"""
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from collections import Counter
+
+from docopt import docopt
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__) + '/..'))
+import jedi  # noqa: E402
+from jedi.api.classes import Completion  # noqa: E402
+from jedi.inference.arguments import TreeArguments  # noqa: E402
+from jedi.inference.base_value import ValueSet, ContextualizedNode  # noqa: E402
+from jedi.inference.lazy_value import AbstractLazyValue  # noqa: E402
+from jedi.inference.names import AbstractNameDefinition  # noqa: E402
+
+_HOT_CLASSES = (AbstractNameDefinition, ValueSet, ContextualizedNode,
+                AbstractLazyValue, TreeArguments, Completion)
+
+
+def _instance_size(obj):
+    """Returns the size of an object including its ``__dict__``."""
+    try:
+        dct = object.__getattribute__(obj, '__dict__')
+    except AttributeError:
+        return sys.getsizeof(obj), False
+    return sys.getsizeof(obj) + sys.getsizeof(dct), True
+
+
+def count_hot_objects():
+    counts = Counter()
+    sizes = Counter()
+    has_dict = {}
+    for obj in gc.get_objects():
+        if isinstance(obj, _HOT_CLASSES):
+            cls = type(obj)
+            size, has_dict[cls] = _instance_size(obj)
+            counts[cls] += 1
+            sizes[cls] += size
+    return counts, sizes, has_dict
+
+
+def main(args):
+    path = args['<file>']
+    step = int(args['-n'])
+    with open(path) as f:
+        code = f.read()
+    lines = code.splitlines()
+
+    tracemalloc.start()
+    start = time.time()
+    scripts = []
+    for line_nr in range(step, len(lines) + 1, step):
+        script = jedi.Script(code, path=path)
+        script.complete(line_nr, len(lines[line_nr - 1]))
+        # Keep the scripts alive, so their objects can be counted.
+        scripts.append(script)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print('Completions: %s in %.2fs' % (len(scripts), time.time() - start))
+    print('Memory: current %.1f MB, peak %.1f MB' % (current / 2 ** 20, peak / 2 ** 20))
+    print()
+    print('   Count |  Bytes/obj | __dict__ | Class')
+    print('-----------------------------------------')
+    counts, sizes, has_dict = count_hot_objects()
+    for cls, count in counts.most_common(20):
+        print('%8d | %10.1f | %8s | %s' % (
+            count, sizes[cls] / count, has_dict[cls], cls.__name__))
+
+
+if __name__ == '__main__':
+    args = docopt(__doc__)
+    if args['<file>'] is None:
+        args['<file>'] = jedi.api.classes.__file__
+    main(args)
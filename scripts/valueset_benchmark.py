@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+"""
+Micro benchmark for ``jedi.inference.base_value.ValueSet``. Most value sets
+contain zero to two values, which is what is measured here. Run it on two
+revisions to compare ValueSet implementations.
+
+Usage:
+  valueset_benchmark.py [-n <number>]
+  valueset_benchmark.py -h | --help
+
+Options:
+  -h --help     Show this screen.
+  -n <number>   Number of loops per operation [default: 200000].
+"""
+import os
+import sys
+import timeit
+
+from docopt import docopt
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__) + '/..'))
+from jedi.inference.base_value import ValueSet, NO_VALUES  # noqa: E402
+
+
+class _InferenceState:
+    def execute(self, value, arguments):
+        return value.result
+
+
+class _Value:
+    inference_state = _InferenceState()
+
+    def __init__(self):
+        self.result = ValueSet([self])
+
+    def infer(self):
+        return self.result
+
+    def execute_annotation(self):
+        return self.result
+
+    def py__getattribute__(self, name):
+        return self.result
+
+
+def main(args):
+    number = int(args['-n'])
+    a = _Value()
+    b = _Value()
+    single = ValueSet([a])
+    double = ValueSet([a, b])
+    operations = [
+        ('ValueSet([])', lambda: ValueSet([])),
+        ('ValueSet([a])', lambda: ValueSet([a])),
+        ('from_sets(empty, empty)', lambda: ValueSet.from_sets([NO_VALUES, NO_VALUES])),
+        ('from_sets(single, empty)', lambda: ValueSet.from_sets([single, NO_VALUES])),
+        ('from_sets(single, double)', lambda: ValueSet.from_sets([single, double])),
+        ('single | empty', lambda: single | NO_VALUES),
+        ('single | double', lambda: single | double),
+        ('single.execute()', lambda: single.execute(None)),
+        ('double.execute()', lambda: double.execute(None)),
+        ('single.py__getattribute__()', lambda: single.py__getattribute__('x')),
+        ('single.infer()', lambda: single.infer()),
+        ('single.execute_annotation()', lambda: single.execute_annotation()),
+        ('empty.execute()', lambda: NO_VALUES.execute(None)),
+    ]
+    print('   µs/op | Operation')
+    print('------------------------------')
+    for name, func in operations:
+        seconds = min(timeit.repeat(func, number=number, repeat=7))
+        print('%8.3f | %s' % (seconds / number * 1e6, name))
+
+
+if __name__ == '__main__':
+    main(docopt(__doc__))
@@ -8,6 +8,7 @@ import pytest
 
 import jedi
 from jedi import __doc__ as jedi_doc
+from jedi.api.classes import resolve_details
 from jedi.inference.compiled import CompiledValueName
 from ..helpers import get_example_dir
 
@@ -666,3 +667,26 @@ def test_definition_start_end_position(Script, code, pos, start, end):
     )
     assert name.get_definition_start_position() == start
     assert name.get_definition_end_position() == end
+
+
+def test_resolve_details(Script, disable_typeshed):
+    code = dedent('''\
+        def foo_func(a):
+            """doc"""
+        foo_var = 1
+        foo_''')
+    completions = Script(code).complete()
+    func_details, var_details = resolve_details(completions)
+    assert func_details['type'] == 'function'
+    assert func_details['docstring'] == 'foo_func(a)\n\ndoc'
+    assert [s.to_string() for s in func_details['signatures']] == ['foo_func(a)']
+    assert var_details['type'] == 'statement'
+
+    assert resolve_details(completions, fields=['type']) == [
+        dict(type='function'), dict(type='statement')
+    ]
+    # Nothing is resolved if there's no time left.
+    assert resolve_details(completions, timeout=-1) == [{}, {}]
+
+    with pytest.raises(ValueError):
+        resolve_details(completions, fields=['foo'])
@@ -457,3 +457,36 @@ def test_module_completions(Script, module):
         # Just make sure that there are no errors
         c.type
         c.docstring()
+
+
+def test_trailer_completions_are_cached(Script, monkeypatch, disable_typeshed):
+    from jedi.api.completion import Completion
+
+    calls = []
+    original = Completion._complete_trailer
+
+    def complete_trailer(self, previous_leaf):
+        calls.append(previous_leaf)
+        return original(self, previous_leaf)
+
+    monkeypatch.setattr(Completion, '_complete_trailer', complete_trailer)
+    code = dedent('''\
+        class Foo:
+            def bar_one(self): pass
+            def bar_two(self): pass
+            def baz(self): pass
+        Foo().''')
+    path = os.path.join(root_dir, 'completion_cache_example.py')
+
+    def complete(like_name):
+        return [c.name for c in Script(code + like_name, path=path).complete()]
+
+    assert complete('ba') == ['bar_one', 'bar_two', 'baz']
+    assert complete('bar') == ['bar_one', 'bar_two']
+    assert complete('bar_t') == ['bar_two']
+    assert len(calls) == 1
+
+    # Changing the code before the name invalidates the cache.
+    code = code.replace('baz', 'bar_three')
+    assert complete('bar_t') == ['bar_three', 'bar_two']
+    assert len(calls) == 2
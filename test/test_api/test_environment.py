@@ -8,6 +8,7 @@ from jedi.api.environment import get_default_environment, find_virtualenvs, \
     InvalidPythonEnvironment, find_system_environments, \
     get_system_environment, create_environment, InterpreterEnvironment, \
     get_cached_default_environment
+from jedi.api.environment import _is_safe, _get_cached_info, _set_cached_info
 
 
 def test_sys_path():
@@ -152,3 +153,74 @@ def test_changing_venv(venv_path, monkeypatch):
     get_cached_default_environment()
     monkeypatch.setitem(os.environ, 'VIRTUAL_ENV', sys.executable)
     assert get_cached_default_environment().executable == sys.executable
+
+
+def test_environment_info_is_cached(monkeypatch):
+    environment = create_environment(sys.executable, safe=False)
+
+    def _get_subprocess(self):
+        raise AssertionError('Should not get called!')
+
+    monkeypatch.setattr('jedi.api.environment.Environment._get_subprocess',
+                        _get_subprocess)
+    cached = create_environment(sys.executable, safe=False)
+    assert cached.executable == environment.executable
+    assert cached.path == environment.path
+    assert cached.version_info == environment.version_info
+
+
+def test_environment_info_cache_is_invalidated(tmp_path):
+    path = str(tmp_path.joinpath('python'))
+    with open(path, 'w') as f:
+        f.write('a')
+    _set_cached_info('info', path, ['python', 'prefix', [3, 9, 0]])
+    assert _get_cached_info('info', path) == ['python', 'prefix', [3, 9, 0]]
+
+    # Replacing or upgrading an executable changes its size or modification
+    # time.
+    with open(path, 'w') as f:
+        f.write('ab')
+    assert _get_cached_info('info', path) is None
+
+
+def test_is_safe_hashes_the_executable(tmp_path, monkeypatch):
+    system_executable = tmp_path.joinpath('system_python')
+    system_executable.write_bytes(b'python')
+    executable = tmp_path.joinpath('python')
+    executable.write_bytes(b'python')
+    os.utime(executable, (0, 0))
+    system_environment = create_environment(sys.executable, safe=False)
+    monkeypatch.setattr(system_environment, 'executable', str(system_executable))
+    monkeypatch.setattr('jedi.api.environment.find_system_environments',
+                        lambda: [system_environment])
+    monkeypatch.setattr('jedi.api.environment._is_unix_safe_simple', lambda path: False)
+    assert _is_safe(str(executable))
+
+    # A replaced executable with the same size and modification time is not
+    # trusted.
+    executable.write_bytes(b'attack')
+    os.utime(executable, (0, 0))
+    assert not _is_safe(str(executable))
+
+
+def test_environment_sys_path_is_cached(monkeypatch):
+    sys_path = create_environment(sys.executable, safe=False).get_sys_path()
+    environment = create_environment(sys.executable, safe=False)
+
+    def get_sys_path(self):
+        raise AssertionError('Should not get called!')
+
+    monkeypatch.setattr(
+        'jedi.inference.compiled.subprocess.CompiledSubprocess.get_sys_path',
+        get_sys_path
+    )
+    assert environment.get_sys_path() == sys_path
+
+
+def test_environment_sys_path_cache_depends_on_variables(monkeypatch, tmp_path):
+    create_environment(sys.executable, safe=False).get_sys_path()
+
+    # The subprocess inherits the environment variables.
+    monkeypatch.setenv('PYTHONPATH', str(tmp_path))
+    sys_path = create_environment(sys.executable, safe=False).get_sys_path()
+    assert str(tmp_path) in sys_path
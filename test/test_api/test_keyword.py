@@ -1,6 +1,8 @@
 """
 Test of keywords and ``jedi.keywords``
 """
+from jedi import settings
+from jedi.api import keywords
 
 
 def test_goto_keyword(Script):
@@ -49,3 +51,20 @@ def test_none_keyword(Script, environment):
     none, = Script('None').complete()
     assert not none.docstring()
     assert none.name == 'None'
+
+
+def test_keyword_help_index(monkeypatch, tmpdir):
+    monkeypatch.setattr(settings, 'cache_directory', str(tmpdir))
+    monkeypatch.setattr(keywords, '_help_index', None)
+    doc = keywords.imitate_pydoc('with')
+    assert 'with' in doc
+    assert keywords.imitate_pydoc('**')
+    assert keywords.imitate_pydoc('undefined') == ''
+
+    # The second time the index is loaded from the cache directory.
+    def build_help_index():
+        raise AssertionError('The help index should not be built again')
+
+    monkeypatch.setattr(keywords, '_help_index', None)
+    monkeypatch.setattr(keywords, '_build_help_index', build_help_index)
+    assert keywords.imitate_pydoc('with') == doc
@@ -6,6 +6,7 @@ import pytest
 from ..helpers import get_example_dir, set_cwd, root_dir, test_dir
 from jedi import Interpreter
 from jedi.api import Project, get_default_project
+from jedi.api import project as project_module
 from jedi.api.project import _is_potential_project, _CONTAINS_POTENTIAL_PROJECT
 
 
@@ -183,3 +184,67 @@ def test_is_potential_project(path, expected):
             expected = False
 
     assert _is_potential_project(path) == expected
+
+
+def test_sys_path_is_cached(Script, monkeypatch):
+    calls = []
+    original = Project._calculate_sys_path
+
+    def calculate_sys_path(*args):
+        calls.append(args)
+        return original(*args)
+
+    monkeypatch.setattr(Project, '_calculate_sys_path', calculate_sys_path)
+    project = Project(test_dir)
+    path = os.path.join(test_dir, 'test_api', 'x.py')
+    sys_path = Script('', path=path, project=project)._inference_state.get_sys_path()
+    assert len(calls) == 1
+
+    # Scripts in the same folder share the sys path.
+    other_path = os.path.join(test_dir, 'test_api', 'y.py')
+    inference_state = Script('', path=other_path, project=project)._inference_state
+    assert inference_state.get_sys_path() == sys_path
+    assert len(calls) == 1
+
+    # The cache depends on the settings of a project, not on the object.
+    Script('', path=path, project=Project(test_dir))._inference_state.get_sys_path()
+    assert len(calls) == 1
+    project.added_sys_path = ['/foo']
+    Script('', path=path, project=project)._inference_state.get_sys_path()
+    assert len(calls) == 2
+
+
+def test_default_project_is_cached(tmp_path, monkeypatch):
+    calls = []
+    original = project_module._find_default_project
+
+    def find_default_project(*args):
+        calls.append(args)
+        return original(*args)
+
+    monkeypatch.setattr(project_module, '_find_default_project', find_default_project)
+    Project(tmp_path).save()
+    package = tmp_path.joinpath('pkg')
+    package.mkdir()
+    package.joinpath('__init__.py').touch()
+    module = package.joinpath('mod.py')
+    module.touch()
+    # Folders that were modified just now are not cached.
+    get_default_project(module)
+    get_default_project(module)
+    assert len(calls) == 2
+    for path in (tmp_path, package, tmp_path.joinpath('.jedi', 'project.json')):
+        os.utime(path, (0, 0))
+
+    project = get_default_project(module)
+    assert project.path == tmp_path
+    assert len(calls) == 3
+    assert get_default_project(package).path == tmp_path
+    # Every caller gets its own project.
+    assert get_default_project(module) is not project
+    assert len(calls) == 3
+
+    # Changing a folder invalidates the cache.
+    Project(package).save()
+    assert get_default_project(module).path == package
+    assert len(calls) == 4
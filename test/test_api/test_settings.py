@@ -1,3 +1,5 @@
+from textwrap import dedent
+
 from jedi import api
 
 
@@ -10,3 +12,28 @@ def foo():
 foo''')
     completions = script.complete()
     assert completions[0].complete == '('
+
+
+def test_collect_statistics(monkeypatch, Script):
+    assert Script('').statistics is None
+
+    monkeypatch.setattr(api.settings, 'collect_statistics', True)
+    script = Script(dedent('''\
+        def foo():
+            return foo()
+        foo().'''))
+    assert script.statistics.parsed_modules == 1
+    assert 'parse' in script.statistics.phase_times
+
+    script.complete()
+    stats = script.statistics
+    assert stats.execute_calls >= 1
+    assert stats.function_executions >= 1
+    assert stats.recursion_limit_hits >= 1
+    assert stats.function_execution_limit == 200
+    assert set(stats.phase_times) >= {'parse', 'complete'}
+
+    # A new call starts with fresh counters.
+    script.get_names()
+    assert set(script.statistics.phase_times) == {'get_names'}
+    assert script.statistics.execute_calls == 0
@@ -1,5 +1,7 @@
 import pytest
 
+from jedi import Project
+from jedi.inference import references
 from ..helpers import test_dir
 
 
@@ -62,3 +64,50 @@ foo()
 
     for place in places:
         assert places == [(n.line, n.column) for n in script.get_references(scope='file', *place)]
+
+
+def test_references_only_in_importing_modules(Script, tmp_path, monkeypatch):
+    tmp_path.joinpath('definition.py').write_text('def some_function(): pass\n')
+    # More modules than the limit of parsed files.
+    for i in range(references._PARSED_FILE_LIMIT + 5):
+        tmp_path.joinpath('user%s.py' % i).write_text(
+            'from definition import some_function\nsome_function()\n'
+        )
+    tmp_path.joinpath('unrelated.py').write_text('def some_function(): pass\n')
+
+    checked = []
+    original_check_fs = references._check_fs
+
+    def check_fs(inference_state, file_io, regex):
+        checked.append(file_io.path.name)
+        return original_check_fs(inference_state, file_io, regex)
+
+    monkeypatch.setattr(references, '_check_fs', check_fs)
+    project = Project(tmp_path)
+    script = Script(path=tmp_path.joinpath('definition.py'), project=project)
+    refs = script.get_references(1, 5)
+    assert len(refs) == 1 + 2 * (references._PARSED_FILE_LIMIT + 5)
+    assert 'unrelated.py' not in checked
+
+    # The modules that import a name are still limited.
+    monkeypatch.setattr(references, '_PARSED_IMPORTER_LIMIT', 10)
+    script = Script(path=tmp_path.joinpath('definition.py'), project=project)
+    refs = script.get_references(1, 5)
+    assert len(refs) == 1 + 2 * 10
+
+
+def test_references_of_attributes_in_modules_without_import(Script, tmp_path):
+    tmp_path.joinpath('defs.py').write_text(
+        'class Model:\n    def compute_total(self): pass\n'
+    )
+    # Methods are used through values, the module doesn't import defs.
+    tmp_path.joinpath('helpers.py').write_text(
+        'def report(obj):\n    return obj.compute_total()\n'
+    )
+    tmp_path.joinpath('main.py').write_text(
+        'from defs import Model\nfrom helpers import report\nreport(Model())\n'
+    )
+    project = Project(tmp_path)
+    script = Script(path=tmp_path.joinpath('defs.py'), project=project)
+    refs = script.get_references(2, 10)
+    assert sorted((r.module_name, r.line) for r in refs) == [('defs', 2), ('helpers', 2)]
@@ -1,6 +1,7 @@
 """
 Test all things related to the ``jedi.cache`` module.
 """
+from jedi.cache import memoize_method
 
 
 def test_cache_get_signatures(Script):
@@ -27,3 +28,24 @@ def test_cache_get_signatures(Script):
 def test_cache_line_split_issues(Script):
     """Should still work even if there's a newline."""
     assert Script('int(\n').get_signatures()[0].name == 'int'
+
+
+def test_memoize_method_with_slots():
+    class Slotted:
+        __slots__ = ('calls', '_memoize_method_dct')
+
+        def __init__(self):
+            self.calls = 0
+
+        @memoize_method
+        def get(self, x):
+            self.calls += 1
+            return x * 2
+
+    s = Slotted()
+    assert s.get(2) == 4
+    assert s.get(2) == 4
+    assert s.get(3) == 6
+    assert s.calls == 2
+    # The cache belongs to the instance.
+    assert Slotted().get(2) == 4
@@ -1,5 +1,13 @@
+import os
 from os.path import join
-from jedi.file_io import FolderIO
+
+import pytest
+
+import jedi
+from jedi import settings
+from jedi.file_io import FolderIO, FileIO
+from jedi.gitignore import Gitignore
+from jedi.inference.references import recurse_find_python_folders_and_files
 from test.helpers import get_example_dir
 
 
@@ -25,3 +33,82 @@ def test_folder_io_walk2():
     root, folder_ios, file_ios = next(iterator)
     folder_ios.clear()
     assert next(iterator, None) is None
+
+
+def test_file_change_notifications(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, 'file_change_notifications', True)
+    path = tmp_path.joinpath('foo.py')
+    path.write_text('')
+    os.utime(path, (0, 0))
+    file_io = FileIO(str(path))
+    assert file_io.get_last_modified() == 0
+
+    # Without a notification the change is not visible.
+    os.utime(path, (1, 1))
+    assert file_io.get_last_modified() == 0
+
+    jedi.notify_changed([path])
+    assert file_io.get_last_modified() == 1
+
+    # Notifications about a folder include everything within it.
+    os.utime(path, (2, 2))
+    jedi.notify_changed([tmp_path])
+    assert file_io.get_last_modified() == 2
+
+    path.unlink()
+    assert file_io.get_last_modified() == 2
+    jedi.notify_changed([path])
+    assert file_io.get_last_modified() is None
+
+    monkeypatch.setattr(settings, 'file_change_notifications', False)
+    path.write_text('')
+    assert file_io.get_last_modified() is not None
+
+
+@pytest.mark.parametrize(
+    'patterns, path, is_dir, expected', [
+        (['foo'], 'foo', False, True),
+        (['foo'], 'a/b/foo', True, True),
+        (['foo'], 'foobar', False, None),
+        (['/foo'], 'a/foo', False, None),
+        (['a/foo'], 'a/foo', False, True),
+        (['a/foo'], 'b/a/foo', False, None),
+        (['foo/'], 'foo', False, None),
+        (['foo/'], 'a/foo', True, True),
+        (['*.py[co]'], 'a/b.pyc', False, True),
+        (['*.py[!co]'], 'b.pyi', False, True),
+        (['*.py[!co]'], 'b.pyc', False, None),
+        (['a/*.py'], 'a/b/c.py', False, None),
+        (['a/**/c.py'], 'a/b/d/c.py', False, True),
+        (['a/**/c.py'], 'a/c.py', False, True),
+        (['**/b'], 'a/b', True, True),
+        (['a/**'], 'a/b/c', False, True),
+        (['b?.py'], 'b1.py', False, True),
+        (['b?.py'], 'b/.py', False, None),
+        (['*.py', '!foo.py'], 'foo.py', False, False),
+        (['*.py', '!foo.py', '*o.py'], 'foo.py', False, True),
+        (['# foo', '', 'foo\\ '], 'foo ', False, True),
+        (['\\#foo', '\\!bar'], '!bar', False, True),
+    ]
+)
+def test_gitignore(patterns, path, is_dir, expected):
+    assert Gitignore(patterns).match(path, is_dir) is expected
+
+
+def test_recurse_with_gitignore(tmp_path):
+    for path in ['a.py', 'b.txt', 'c/d.py', 'c/e.py', 'c/f/g.py',
+                 'h/i.py', 'k/l.py', 'k/m.pyi', 'venv/x.py']:
+        tmp_path.joinpath(path).parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.joinpath(path).write_text('')
+    tmp_path.joinpath('.gitignore').write_text('/h/\ne.py\n*.pyi\n')
+    tmp_path.joinpath('c', '.gitignore').write_text('f\n!e.py\n')
+
+    found = [
+        (folder_io or file_io).path
+        for folder_io, file_io in recurse_find_python_folders_and_files(
+            FolderIO(str(tmp_path)),
+            except_paths=[tmp_path.joinpath('k', 'l.py')],
+        )
+    ]
+    found = sorted(os.path.relpath(p, tmp_path) for p in found)
+    assert found == ['a.py', 'c', join('c', 'd.py'), join('c', 'e.py'), 'k']
@@ -2,6 +2,9 @@ from textwrap import dedent
 
 import pytest
 
+from jedi.inference.base_value import ValueSet, NO_VALUES
+from jedi.inference.gradual import annotation
+
 
 def test_simple_annotations(Script, environment):
     """
@@ -53,3 +56,48 @@ def test_lambda_forward_references(Script, environment):
     # For now just receiving the 3 is ok. I'm doubting that this is what we
     # want. We also execute functions. Should we only execute classes?
     assert Script(source).infer()
+
+
+def test_forward_reference_is_parsed_once(Script):
+    source = dedent('''\
+        class Foo: pass
+        def foo(bar: "Foo", baz: "Foo"):
+            bar
+            baz
+        ''')
+    script = Script(source)
+    bar, = script.infer(3, 4)
+    baz, = script.infer(4, 4)
+    assert bar.name == baz.name == 'Foo'
+
+    module_context = script._get_module_context()
+    first = annotation._get_forward_reference_node(module_context, 'Foo')
+    assert annotation._get_forward_reference_node(module_context, 'Foo') is first
+
+
+def test_generic_classes_are_interned(Script):
+    script = Script('class Foo: pass')
+    foo, = script._get_module_context().py__getattribute__('Foo')
+    assert foo.with_generics((NO_VALUES,)) is foo.with_generics((NO_VALUES,))
+    assert foo.with_generics((NO_VALUES,)) is not foo.with_generics((NO_VALUES, NO_VALUES))
+
+    bar = foo.with_generics((ValueSet([foo]),))
+    assert bar is foo.with_generics((ValueSet([foo]),))
+    assert bar.define_generics({}) == ValueSet([bar])
+
+
+def test_type_var_solving_is_cached(Script):
+    source = dedent('''\
+        from typing import TypeVar, List
+        T = TypeVar('T')
+        def first(x: List[T]) -> T: ...
+        first([1])
+        first([1.0])
+        ''')
+    script = Script(source)
+    assert [d.name for d in script.infer(4)] == ['int']
+    assert [d.name for d in script.infer(5)] == ['float']
+    assert [d.name for d in script.infer(4)] == ['int']
+    cached_functions = [f.__name__ for f in script._inference_state.memoize_cache]
+    assert '_infer_type_vars' in cached_functions
+    assert '_execute_with_type_vars' in cached_functions
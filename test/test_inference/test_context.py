@@ -1,3 +1,6 @@
+from textwrap import dedent
+
+
 def test_module_attributes(Script):
     def_, = Script('__name__').complete()
     assert def_.name == '__name__'
@@ -16,3 +19,25 @@ def test_module__file__(Script, environment):
     def_, = Script('import antigravity; antigravity.__file__').infer()
     value = def_._name._value.get_safe_value()
     assert value.endswith('.pyi')
+
+
+def test_name_resolution_cache(Script):
+    code = dedent('''\
+        x = 1
+        x
+        x
+        if y:
+            x = 2
+            x
+        else:
+            x
+        x
+        ''')
+    script = Script(code)
+    expected = {2: [1], 3: [1], 6: [5], 8: [1], 9: [1, 5]}
+    for _ in range(2):
+        for line, definition_lines in expected.items():
+            column = code.splitlines()[line - 1].index('x')
+            names = script.goto(line, column)
+            assert sorted(n.line for n in names) == definition_lines
+    assert script._inference_state.name_resolution_cache
@@ -8,6 +8,8 @@ from textwrap import dedent
 import pytest
 
 import jedi
+from jedi import settings
+from jedi.inference import docstrings
 from ..helpers import test_dir
 
 try:
@@ -539,3 +541,58 @@ def test_property(name, docstring, goto_or_complete):
     ''')
     n, = goto_or_complete(code + 'Test().' + name)
     assert n.docstring() == docstring
+
+
+def _get_public_names(completions):
+    return [c.name for c in completions if not c.name.startswith('_')]
+
+
+def test_google_docstring_types(Script):
+    s = dedent('''
+    class Foo:
+        def bar(self): pass
+
+    def foobar(x, y):
+        """
+        Args:
+            x (Foo): A foo.
+            y (int, optional): Not used.
+
+        Returns:
+            Foo: Another foo.
+        """
+        x.''')
+    assert _get_public_names(Script(s).complete()) == ['bar']
+    assert _get_public_names(Script(s + '\nfoobar().').complete()) == ['bar']
+
+
+@pytest.mark.parametrize('parser', ['builtin', 'auto'])
+def test_numpy_docstring_builtin_parser(Script, monkeypatch, parser):
+    monkeypatch.setattr(settings, 'docstring_parser', parser)
+    s = dedent('''
+    class Foo:
+        def bar(self): pass
+
+    def foobar(x, y):
+        """
+        Parameters
+        ----------
+        x, y : Foo, optional
+            Some foos.
+
+        Returns
+        -------
+        Foo
+        """
+        y.''')
+    if parser == 'auto' and not numpydoc_unavailable:
+        pytest.skip('numpydoc does not split parameter names')
+    assert _get_public_names(Script(s).complete()) == ['bar']
+    assert _get_public_names(Script(s + '\nfoobar().').complete()) == ['bar']
+
+
+def test_parsed_docstring_is_cached():
+    docstring = ':type x: int'
+    parsed = docstrings._get_parsed_docstring(docstring)
+    assert parsed is docstrings._get_parsed_docstring(docstring)
+    assert parsed.get_param_types('x') == ['int']
@@ -7,6 +7,7 @@ from jedi.inference.gradual import typeshed
 from jedi.inference.value import TreeInstance, BoundMethod, FunctionValue, \
     MethodValue, ClassValue
 from jedi.inference.names import StubName
+from jedi.inference.compiled import builtin_from_name
 
 TYPESHED_PYTHON3 = os.path.join(typeshed.TYPESHED_PATH, 'stdlib', '3')
 
@@ -240,3 +241,20 @@ def test_django_exists_only_as_stub(Script):
     else:
         pytest.skip('django is already installed, it should only exist as a stub for this test')
     assert not Script('import django').infer()
+
+
+def test_builtin_names_are_cached(Script):
+    inference_state = Script('')._inference_state
+    first = next(inference_state.builtins_module.get_filters())
+    second = next(inference_state.builtins_module.get_filters())
+    assert first is second
+    len_name, = first.get('len')
+    assert second.get('len') == [len_name]
+
+    assert builtin_from_name(inference_state, 'str') \
+        is builtin_from_name(inference_state, 'str')
+
+    typing_filter = next(inference_state.typing_module.get_filters())
+    list_name, = typing_filter.get('List')
+    list_name2, = next(inference_state.typing_module.get_filters()).get('List')
+    assert list_name.tree_name is list_name2.tree_name
@@ -0,0 +1,104 @@
+import os
+
+from jedi import Project
+from jedi.inference import references
+from jedi.inference.import_graph import build_import_graph
+
+
+def _create_modules(root, modules):
+    paths = []
+    for name, code in modules.items():
+        path = root.joinpath(*name.split('/'))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(code)
+        paths.append(path)
+    return paths
+
+
+def test_import_graph(tmp_path):
+    paths = _create_modules(tmp_path, {
+        'a.py': 'import pkg.b as b, os  # comment\n',
+        'pkg/__init__.py': 'from . import c\n',
+        'pkg/b.py': 'from .c import (\n    x,\n    y\n)\n',
+        'pkg/c.py': 'from pkg.sub import d; import a\n',
+        'pkg/sub/__init__.py': '',
+        'pkg/sub/d.py': '"""\nimport e\n"""\n',
+        'e.py': 'import json\n',
+    })
+    graph = build_import_graph(paths)
+
+    def imports(name):
+        return {
+            os.path.relpath(p, tmp_path).replace(os.path.sep, '/')
+            for p in graph.get_imports(tmp_path.joinpath(name))
+        }
+
+    assert imports('a.py') == {'pkg/__init__.py', 'pkg/b.py'}
+    # Submodules are attributes of their packages.
+    assert imports('pkg/__init__.py') == {'pkg/b.py', 'pkg/c.py', 'pkg/sub/__init__.py'}
+    assert imports('pkg/b.py') == {'pkg/__init__.py', 'pkg/c.py'}
+    assert imports('pkg/c.py') == {
+        'pkg/__init__.py', 'pkg/sub/__init__.py', 'pkg/sub/d.py', 'a.py'
+    }
+    assert imports('pkg/sub/__init__.py') == {'pkg/sub/d.py'}
+    # Imports in strings are found as well, a regex is used.
+    assert imports('pkg/sub/d.py') == {'e.py'}
+    assert imports('e.py') == set()
+
+    distances = graph.get_importer_distances([tmp_path.joinpath('pkg', 'c.py')])
+    assert distances[str(tmp_path.joinpath('pkg', 'c.py'))] == 0
+    assert distances[str(tmp_path.joinpath('pkg', 'b.py'))] == 1
+    assert distances[str(tmp_path.joinpath('pkg', '__init__.py'))] == 1
+    assert distances[str(tmp_path.joinpath('a.py'))] == 2
+    assert str(tmp_path.joinpath('e.py')) not in distances
+
+    ordered = graph.sort_by_reachability([tmp_path.joinpath('pkg', 'sub', 'd.py')])
+    assert ordered[:2] == [str(tmp_path.joinpath('pkg', 'sub', 'd.py')),
+                           str(tmp_path.joinpath('pkg', 'c.py'))]
+    assert ordered[-1] == str(tmp_path.joinpath('e.py'))
+
+
+def test_import_graph_is_updated(tmp_path):
+    paths = _create_modules(tmp_path, {'a.py': '', 'b.py': ''})
+    assert build_import_graph(paths).get_imports(paths[0]) == set()
+
+    paths[0].write_text('import b\n')
+    os.utime(paths[0], (0, 0))
+    graph = build_import_graph(paths)
+    assert graph.get_imports(paths[0]) == {str(paths[1])}
+    assert graph.get_importers(paths[1]) == {str(paths[0])}
+
+
+def test_project_import_graph_is_cached(Script, tmp_path, monkeypatch):
+    paths = _create_modules(tmp_path, {'a.py': '', 'b.py': ''})
+    for path in paths + [tmp_path]:
+        os.utime(path, (0, 0))
+    calls = []
+
+    def build(paths):
+        calls.append(paths)
+        return build_import_graph(paths)
+
+    monkeypatch.setattr(references, 'build_import_graph', build)
+
+    def get_graph():
+        script = Script('', project=Project(tmp_path))
+        return references.get_project_import_graph(script._inference_state)
+
+    # The graph is shared by inference states.
+    graph = get_graph()
+    assert get_graph() is graph
+    assert len(calls) == 1
+
+    # Changing a module builds the graph again.
+    paths[1].write_text('import a\n')
+    os.utime(paths[1], (1, 1))
+    assert get_graph().get_imports(paths[1]) == {str(paths[0])}
+    assert len(calls) == 2
+
+    # Adding a module changes the folder, the project is walked again.
+    new_path, = _create_modules(tmp_path, {'c.py': 'import b\n'})
+    os.utime(new_path, (2, 2))
+    os.utime(tmp_path, (2, 2))
+    assert get_graph().get_imports(new_path) == {str(paths[1])}
+    assert len(calls) == 3
@@ -9,10 +9,15 @@ from pathlib import Path
 import pytest
 
 import jedi
+from jedi.archives import get_archive_index
 from jedi.file_io import FileIO
 from jedi.inference import compiled
 from jedi.inference import imports
 from jedi.api.project import Project
+from jedi.api.environment import InterpreterEnvironment
+from jedi.inference import snapshot as snapshot_module
+from jedi.inference.snapshot import get_import_snapshot, save_import_snapshots, \
+    ImportSnapshot
 from jedi.inference.gradual.conversion import _stub_to_python_value_set
 from jedi.inference.references import get_module_contexts_containing_name
 from ..helpers import get_example_dir, test_dir, test_dir_project, root_dir
@@ -116,6 +121,79 @@ def test_find_module_not_package_zipped(Script, inference_state, environment):
     assert is_package is False
 
 
+def test_zipped_package_index(Script, environment):
+    sys_path = environment.get_sys_path() + [str(pkg_zip_path)]
+    project = Project('.', sys_path=sys_path)
+
+    completions = Script('import pkg; pkg.n', project=project).complete()
+    assert [c.name for c in completions] == ['namespace', 'nested']
+    completions = Script('import pkg.nested.n', project=project).complete()
+    assert [c.name for c in completions] == ['nested_module']
+    assert 'pkg' in [c.name for c in Script('import pk', project=project).complete()]
+
+    index, folder = get_archive_index(pkg_zip_path.joinpath('pkg', 'nested'))
+    assert folder == 'pkg/nested'
+    assert index.find_module(folder, 'nested_module') == ('pkg/nested/nested_module.py', False)
+    assert index.find_module('pkg', 'nested') == ('pkg/nested/__init__.py', True)
+    assert index.find_module('pkg', 'namespace') == (None, True)
+    assert index.find_module('pkg', 'doesnt_exist') == (None, None)
+    assert index.read('pkg/module.py') is index.read('pkg/module.py')
+    assert get_archive_index(pkg_zip_path)[0] is index
+    assert get_archive_index(pkg_zip_path.parent) is None
+
+
+def test_import_snapshot(Script, environment, tmp_path):
+    if isinstance(environment, InterpreterEnvironment):
+        pytest.skip("Imports are not stored for the same process")
+    tmp_path.joinpath('snapshot_mod.py').write_text('x = 1\n')
+    os.utime(tmp_path, (0, 0))
+    sys_path = environment.get_sys_path() + [str(tmp_path)]
+
+    def infer():
+        project = Project(tmp_path, sys_path=sys_path)
+        script = Script('import snapshot_mod; snapshot_mod.x', project=project)
+        value, = script.infer()
+        assert value.name == 'int'
+        return script._inference_state
+
+    inference_state = infer()
+    snapshot = get_import_snapshot(inference_state, inference_state.get_sys_path())
+    file_io, is_package = snapshot.get('snapshot_mod')
+    assert file_io.path == tmp_path.joinpath('snapshot_mod.py')
+    assert is_package is False
+
+    # Restore the snapshot like a new process does.
+    save_import_snapshots()
+    snapshot_module._snapshots.clear()
+    inference_state = infer()
+    restored = get_import_snapshot(inference_state, inference_state.get_sys_path())
+    assert restored is not snapshot
+    assert restored.get('snapshot_mod')[0].path == file_io.path
+
+    # Changing a folder on the sys path invalidates the snapshot.
+    tmp_path.joinpath('other.py').write_text('')
+    inference_state = infer()
+    assert get_import_snapshot(inference_state, inference_state.get_sys_path()) is None
+
+
+def test_import_snapshots_are_saved_and_pruned(monkeypatch, tmp_path):
+    monkeypatch.setattr(jedi.settings, 'cache_directory', str(tmp_path))
+    monkeypatch.setattr(snapshot_module, '_SAVE_INTERVAL', 2)
+    monkeypatch.setattr(snapshot_module, '_MAX_SNAPSHOT_FILES', 2)
+    folder = tmp_path.joinpath('import_snapshots')
+
+    for i in range(3):
+        snapshot = ImportSnapshot(str(i), None, [])
+        snapshot.add('a', None, False)
+        assert not folder.joinpath('%s.json' % i).exists()
+        # Snapshots are stored after a few new imports.
+        snapshot.add('b', None, False)
+        os.utime(folder.joinpath('%s.json' % i), (i, i))
+
+    # Only the most recently used snapshots are kept.
+    assert sorted(os.listdir(folder)) == ['1.json', '2.json']
+
+
 def test_import_not_in_sys_path(Script, environment):
     """
     non-direct imports (not in sys.path)
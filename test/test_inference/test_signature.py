@@ -386,3 +386,25 @@ def test_enum(Script):
         Planet.MERCURY''')
     completion, = script.complete()
     assert not completion.get_signatures()
+
+
+def test_django_model_fields_are_cached(Script, has_django):
+    if not has_django:
+        pytest.skip('Needs django to be installed to run this test.')
+    script = Script(dedent('''\
+        from django.db import models
+
+        class Tag(models.Model):
+            tag_name = models.CharField()
+            tag_count = models.IntegerField()
+
+        Tag.objects.filter(
+        Tag('''))
+    for line in (7, 8):
+        sig, = script.get_signatures(line=line)
+        assert [p.name for p in sig.params] == ['tag_name', 'tag_count']
+
+    # The fields are only collected once for the filter and the constructor.
+    memo, = [memo for function, memo in script._inference_state.memoize_cache.items()
+             if function.__name__ == '_find_fields']
+    assert len(memo) == 1
@@ -0,0 +1,23 @@
+from jedi.inference.base_value import ValueSet, NO_VALUES
+
+
+def test_from_sets():
+    a, b, c = object(), object(), object()
+    single = ValueSet([a])
+
+    assert ValueSet.from_sets([]) is NO_VALUES
+    assert ValueSet.from_sets([NO_VALUES, []]) is NO_VALUES
+    # No need to create a new set if there's only one non-empty set.
+    assert ValueSet.from_sets([NO_VALUES, single, NO_VALUES]) is single
+    assert ValueSet.from_sets([[a], NO_VALUES]) == single
+    assert ValueSet.from_sets([single, [b]]) == ValueSet([a, b])
+    assert ValueSet.from_sets([single, [b], ValueSet([a, c])]) == ValueSet([a, b, c])
+
+
+def test_or():
+    a, b = object(), object()
+    single = ValueSet([a])
+    assert single | NO_VALUES is single
+    assert NO_VALUES | single is single
+    assert single | ValueSet([b]) == ValueSet([a, b])
+    assert (single & ValueSet([b])) is NO_VALUES
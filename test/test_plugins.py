@@ -0,0 +1,51 @@
+from jedi import Project
+from jedi.plugins import plugin_manager
+from jedi.plugins import pytest as pytest_plugin
+
+
+def test_profile(Script):
+    script = Script('import collections; collections.namedtuple("A", "x")().x')
+    with plugin_manager.profile() as profile:
+        script.infer()
+    assert profile.calls[('jedi.plugins.stdlib', 'execute')] > 0
+    assert profile.times[('jedi.plugins.stdlib', 'execute')] > 0
+    assert 'jedi.plugins.stdlib.execute' in profile.as_dict()
+
+    # The plugins are not measured anymore afterwards.
+    calls = dict(profile.calls)
+    Script('import collections; collections.namedtuple("A", "x")').infer()
+    assert profile.calls == calls
+
+
+def test_pytest_fixture_index(Script, tmp_path, monkeypatch):
+    calls = []
+    original = pytest_plugin.FixtureFilter._is_fixture
+
+    def is_fixture(self, decorated):
+        calls.append(decorated)
+        return original(self, decorated)
+
+    monkeypatch.setattr(pytest_plugin.FixtureFilter, '_is_fixture', is_fixture)
+    tmp_path.joinpath('conftest.py').write_text(
+        'import pytest\n\n@pytest.fixture\ndef my_first():\n    pass\n'
+    )
+
+    def create_script():
+        return Script('def test_x(my_', path=tmp_path.joinpath('test_x.py'),
+                      project=Project(tmp_path))
+
+    def complete(script):
+        return [c.name for c in script.complete()]
+
+    script = create_script()
+    assert complete(script) == ['my_first']
+    assert calls
+    # The fixtures of a folder are only collected once per inference state.
+    calls.clear()
+    assert complete(script) == ['my_first']
+    assert not calls
+
+    # Other inference states (e.g. with other environments) collect them
+    # again.
+    assert complete(create_script()) == ['my_first']
+    assert calls